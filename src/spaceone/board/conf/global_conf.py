@@ -1,6 +1,45 @@
 # Email Settings
 EMAIL_SERVICE_NAME = "Cloudforet"
 EMAIL_SEND_RETRY_INTERVAL = 180
+# SINGLE: one message per recipient
+# BCC: one message per batch, recipients hidden in the envelope
+# RCPT: one message per batch, recipients listed in To
+EMAIL_DELIVERY_MODE = "SINGLE"
+EMAIL_BATCH_SIZE = 50
+EMAIL_SEND_CONCURRENCY = 1
+EMAIL_SEND_QUEUE = "board_q"  # runs in the request when the queue is not configured
+POST_SEND_JOB_STALE_TIMEOUT = 1800  # seconds without progress before a job is retried
+
+# Recipient Resolution Settings
+RECIPIENT_RESOLVE_CONCURRENCY = 10
+RECIPIENT_RESOLVE_TIMEOUT = 60  # seconds per identity lookup of a domain
+RECIPIENT_RESOLVE_TOTAL_TIMEOUT = 3600  # seconds of waiting for all domains
+RECIPIENT_PAGE_SIZE = 1000
+RECIPIENT_DEDUP_MAX_SIZE = 1000000
+DOMAIN_CONFIG_PREFETCH_PAGE_SIZE = 500  # domains per DomainConfig.list call
+NEGATIVE_CACHE_EXPIRE = 300  # seconds, for missing configs and empty identity lookups
+
+# Post Cache Settings
+POST_CACHE_EXPIRE = 60  # seconds
+NOTICE_FEED_CACHE_EXPIRE = 300  # seconds, popup/pinned feed per domain and workspace
+POST_STAT_CACHE_EXPIRE = 30  # seconds
+POST_STAT_MATERIALIZED_COUNT = True  # count-by-board_type/category from PostCount
+POST_COUNT_BUILD_TIMEOUT = 600  # seconds before a stopped count build is taken over
+
+# Contents Settings
+POST_EXCERPT_LENGTH = 200
+
+# List Settings
+LIST_CURSOR_PAGE_SIZE = 100
+
+# View Count Settings
+VIEW_COUNT_MODE = "BUFFERED"  # BUFFERED | SYNC
+VIEW_COUNT_FLUSH_INTERVAL = 10  # seconds
+VIEW_COUNT_FLUSH_THRESHOLD = 1000
+
+# File Manager Settings
+FILE_MANAGER_CONCURRENCY = 10
+FILE_INFO_CACHE_EXPIRE = 300  # must be shorter than the download url expiry
 
 # Database Settings
 DATABASES = {
@@ -13,6 +52,8 @@ DATABASES = {
     }
 }
 
+CHECK_INDEX_COVERAGE = True  # log index coverage of post queries on startup
+
 # Cache Settings
 CACHES = {
     "default": {
@@ -24,6 +65,43 @@ CACHES = {
     }
 }
 
+# Decoded token claims, per process
+TOKEN_CLAIMS_CACHE_MAX_SIZE = 1000
+TOKEN_CLAIMS_CACHE_EXPIRE = 300  # seconds, never past the token's exp
+
+# In-process L1 cache in front of CACHES["default"], per key prefix
+L1_CACHE_MAX_SIZE = 10000
+SINGLE_FLIGHT_TIMEOUT = 30  # seconds to wait for a concurrent load of the same key
+CACHE_EARLY_REFRESH = False  # refresh hot keys before they expire
+CACHE_EARLY_REFRESH_BETA = 1.0  # > 1 refreshes earlier
+L1_CACHE_POLICIES = {
+    "board:domain-config-settings:": {"expire": 60},
+    "board:file:": {"expire": 30},
+    "board:file-download-url:": {"expire": 30},
+    "board:post-info:": {"expire": 5},
+    "board:post-notice-feed:": {"expire": 5},
+}
+
+# Queue Settings
+QUEUES = {
+    # "board_q": {
+    #     "backend": "spaceone.core.queue.redis_queue.RedisQueue",
+    #     "host": "redis",
+    #     "port": 6379,
+    #     "channel": "board_job",
+    # },
+}
+
+# Scheduler Settings
+SCHEDULERS = {}
+WORKERS = {
+    # "board_worker": {
+    #     "backend": "spaceone.core.scheduler.worker.BaseWorker",
+    #     "queue": "board_q",
+    #     "pool": 10,
+    # },
+}
+
 # Handler Configuration
 HANDLERS = {
     "authentication": [
@@ -60,6 +138,8 @@ CONNECTORS = {
         # "user": "cloudforet",
         # "password": "1234",
         # "from_email": "support@cloudforet.com",
+        # "pool_size": 5,
+        # "timeout": 30,
     },
 }
 
@@ -1,5 +1,9 @@
+import atexit
 import logging
+import queue
 import smtplib
+import threading
+from contextlib import contextmanager
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 
@@ -11,44 +15,182 @@ __all__ = ["SMTPConnector"]
 
 _LOGGER = logging.getLogger(__name__)
 
+_SMTP_POOLS = {}
+_SMTP_POOLS_LOCK = threading.Lock()
+
 
 class SMTPConnector(BaseConnector):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.smtp = None
-        host = self.config.get("host")
-        port = self.config.get("port")
-        user = self.config.get("user")
-        password = self.config.get("password")
         self.from_email = self.config.get("from_email")
-        self.set_smtp(host, port, user, password)
+        self.pool = _get_smtp_pool(self.config)
+        self.pool.check()
 
-    def set_smtp(self, host, port, user, password):
-        try:
-            self.smtp = smtplib.SMTP(host, port)
-            self.smtp.connect(host, port)
-            self.smtp.ehlo()
-            self.smtp.starttls()
-            self.smtp.login(user, password)
-        except Exception as e:
-            _LOGGER.error(f"[set_smtp] set smtp failed : Please check smtp config {e}")
-            raise ERROR_SMTP_CONNECTION_FAILED()
+    def send_email(self, to_emails, subject, contents, bcc=False) -> dict:
+        if isinstance(to_emails, str):
+            to_emails = to_emails.split(",")
+
+        if not isinstance(contents, MIMEText):
+            contents = self.make_html_part(contents)
 
-    def send_email(self, to_emails, subject, contents):
         multipart_msg = MIMEMultipart("alternative")
 
         multipart_msg["Subject"] = subject
         multipart_msg["From"] = self.from_email
-        multipart_msg["To"] = to_emails
 
-        multipart_msg.attach(MIMEText(contents, "html"))
+        if bcc:
+            # Recipients only appear in the envelope, so they never see each
+            # other's addresses.
+            multipart_msg["To"] = self.from_email
+        else:
+            multipart_msg["To"] = ",".join(to_emails)
 
-        response = self.smtp.sendmail(
-            self.from_email, to_emails.split(","), multipart_msg.as_string()
-        )
+        multipart_msg.attach(contents)
+
+        try:
+            response = self._sendmail(to_emails, multipart_msg.as_string())
+        except smtplib.SMTPRecipientsRefused as e:
+            response = e.recipients
 
         if response:
             _LOGGER.debug(f"[send_email] send email response : {response}")
 
+        return response
+
+    @staticmethod
+    def make_html_part(contents: str) -> MIMEText:
+        return MIMEText(contents, "html")
+
+    def _sendmail(self, to_emails: list, message: str) -> dict:
+        try:
+            with self.pool.session() as smtp:
+                return smtp.sendmail(self.from_email, to_emails, message)
+        except smtplib.SMTPServerDisconnected as e:
+            # The server dropped an idle session between the health check and
+            # the transaction. Retry once on a freshly connected session.
+            _LOGGER.debug(f"[_sendmail] smtp session disconnected, retry : {e}")
+            with self.pool.session(reconnect=True) as smtp:
+                return smtp.sendmail(self.from_email, to_emails, message)
+
     def quit_smtp(self):
-        self.smtp.quit()
+        self.pool.close()
+
+
+class SMTPSessionPool(object):
+    def __init__(self, host, port, user, password, size=5, timeout=30):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self._sessions = queue.LifoQueue(maxsize=size)
+        self._semaphore = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def session(self, reconnect=False):
+        self._semaphore.acquire()
+        smtp = None
+        try:
+            smtp = self._acquire(reconnect)
+            yield smtp
+        except smtplib.SMTPServerDisconnected:
+            self._quit(smtp)
+            smtp = None
+            raise
+        finally:
+            if smtp:
+                self._release(smtp)
+            self._semaphore.release()
+
+    def check(self):
+        with self.session():
+            pass
+
+    def close(self):
+        while True:
+            try:
+                smtp = self._sessions.get_nowait()
+            except queue.Empty:
+                break
+
+            self._quit(smtp)
+
+    def _acquire(self, reconnect=False):
+        if reconnect:
+            return self._connect()
+
+        try:
+            smtp = self._sessions.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+        if not self._is_alive(smtp):
+            self._quit(smtp)
+            return self._connect()
+
+        return smtp
+
+    def _release(self, smtp):
+        try:
+            self._sessions.put_nowait(smtp)
+        except queue.Full:
+            self._quit(smtp)
+
+    def _connect(self):
+        try:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            smtp.ehlo()
+            smtp.starttls()
+            smtp.login(self.user, self.password)
+            return smtp
+        except Exception as e:
+            _LOGGER.error(f"[_connect] set smtp failed : Please check smtp config {e}")
+            raise ERROR_SMTP_CONNECTION_FAILED()
+
+    @staticmethod
+    def _is_alive(smtp) -> bool:
+        try:
+            status, _ = smtp.noop()
+            return status == 250
+        except smtplib.SMTPException:
+            return False
+        except OSError:
+            return False
+
+    @staticmethod
+    def _quit(smtp) -> None:
+        if smtp is None:
+            return
+
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+
+def _get_smtp_pool(smtp_config: dict) -> SMTPSessionPool:
+    host = smtp_config.get("host")
+    port = smtp_config.get("port")
+    user = smtp_config.get("user")
+
+    pool_key = (host, port, user)
+
+    with _SMTP_POOLS_LOCK:
+        if pool_key not in _SMTP_POOLS:
+            _SMTP_POOLS[pool_key] = SMTPSessionPool(
+                host,
+                port,
+                user,
+                smtp_config.get("password"),
+                size=int(smtp_config.get("pool_size", 5)),
+                timeout=int(smtp_config.get("timeout", 30)),
+            )
+
+        return _SMTP_POOLS[pool_key]
+
+
+@atexit.register
+def _close_smtp_pools() -> None:
+    with _SMTP_POOLS_LOCK:
+        for pool in _SMTP_POOLS.values():
+            pool.close()
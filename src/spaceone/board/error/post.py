@@ -24,9 +24,21 @@ class ERROR_NOTICE_EMAIL_ALREADY_SENT(ERROR_UNKNOWN):
     _message = "Notice email has already been sent. please try again later. (post_id = {post_id})"
 
 
+class ERROR_RECIPIENTS_NOT_RESOLVED(ERROR_UNKNOWN):
+    _message = "Failed to resolve notice email recipients. (failed_domain_count = {failed_domain_count})"
+
+
 class ERROR_INVALID_CONTENTS(ERROR_INVALID_ARGUMENT):
     _message = "Content is invalid. please check the content."
 
 
 class ERROR_INVALID_CONTENTS_TYPE(ERROR_INVALID_ARGUMENT):
     _message = "Content type is invalid. Please check the content. (contents_type = {contents_type})"
+
+
+class ERROR_INVALID_NEXT_TOKEN(ERROR_INVALID_ARGUMENT):
+    _message = "Next token is invalid. Please list again from the first page."
+
+
+class ERROR_NOT_SUPPORTED_FILTER(ERROR_INVALID_ARGUMENT):
+    _message = "Filter operator is not supported in this query. (key = {key}, operator = {operator})"
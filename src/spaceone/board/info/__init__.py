@@ -1,2 +1,3 @@
 from spaceone.board.info.common_info import *
 from spaceone.board.info.post_info import *
+from spaceone.board.info.post_send_job_info import *
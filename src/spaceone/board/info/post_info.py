@@ -1,4 +1,4 @@
-import functools
+import operator
 
 from spaceone.api.board.v1 import post_pb2
 from spaceone.core.pygrpc.message_type import change_struct_type, change_list_value_type
@@ -8,42 +8,100 @@ from spaceone.board.model.post_model import Post
 
 __all__ = ["PostInfo", "PostsInfo"]
 
+# Field accessors are built once, so a row costs one C-level getter call
+# instead of a Python attribute lookup per field.
+_MINIMAL_FIELDS = (
+    "board_type",
+    "post_id",
+    "category",
+    "title",
+    "resource_group",
+    "domain_id",
+    "workspaces",
+    "contents_type",
+)
+# html_contents and excerpt are only sent if the installed spaceone-api
+# defines them in PostInfo; older messages reject unknown fields.
+_FULL_FIELDS = tuple(
+    field
+    for field in (
+        "contents",
+        "html_contents",
+        "excerpt",
+        "view_count",
+        "writer",
+        "user_id",
+    )
+    if field in post_pb2.PostInfo.DESCRIPTOR.fields_by_name
+)
+_EXTRA_FIELDS = ("options", "files", "created_at", "updated_at")
+
+_HAS_NEXT_TOKEN = "next_token" in post_pb2.PostsInfo.DESCRIPTOR.fields_by_name
+
+_get_minimal_values = operator.attrgetter(*_MINIMAL_FIELDS)
+_get_full_values = operator.attrgetter(*_FULL_FIELDS, *_EXTRA_FIELDS)
+
+_datetime_to_iso8601 = utils.datetime_to_iso8601
+
+_OPTIONS_STRUCTS = {}
+
 
 def PostInfo(post_vo: Post, minimal=False, files_info=None):
-    info = {
-        "board_type": post_vo.board_type,
-        "post_id": post_vo.post_id,
-        "category": post_vo.category,
-        "title": post_vo.title,
-        "resource_group": post_vo.resource_group,
-        "domain_id": post_vo.domain_id,
-        "workspaces": post_vo.workspaces,
-        "contents_type": post_vo.contents_type,
-    }
+    """Build PostInfo from a Post or a raw post document (dict)"""
+
+    if isinstance(post_vo, dict):
+        info = {field: post_vo.get(field) for field in _MINIMAL_FIELDS}
+    else:
+        info = dict(zip(_MINIMAL_FIELDS, _get_minimal_values(post_vo)))
 
     if not minimal:
-        info.update(
-            {
-                "contents": post_vo.contents,
-                "view_count": post_vo.view_count,
-                "writer": post_vo.writer,
-                "options": change_struct_type(post_vo.options),
-                "user_id": post_vo.user_id,
-                "created_at": utils.datetime_to_iso8601(post_vo.created_at),
-                "updated_at": utils.datetime_to_iso8601(post_vo.updated_at),
-            }
-        )
+        if isinstance(post_vo, dict):
+            values = [post_vo.get(field) for field in _FULL_FIELDS + _EXTRA_FIELDS]
+        else:
+            values = _get_full_values(post_vo)
+
+        info.update(zip(_FULL_FIELDS, values))
+        options, files, created_at, updated_at = values[len(_FULL_FIELDS) :]
+
+        info["options"] = _make_options_struct(options)
+        info["created_at"] = _datetime_to_iso8601(created_at)
+        info["updated_at"] = _datetime_to_iso8601(updated_at)
 
         if files_info:
             info["files"] = change_list_value_type(files_info)
         else:
-            info["files"] = change_list_value_type(post_vo.files)
+            info["files"] = change_list_value_type(files or [])
 
     return post_pb2.PostInfo(**info)
 
 
-def PostsInfo(post_vos, total_count, **kwargs):
-    return post_pb2.PostsInfo(
-        results=list(map(functools.partial(PostInfo, **kwargs), post_vos)),
-        total_count=total_count,
-    )
+def PostsInfo(post_vos, total_count, next_token=None, minimal=False, **kwargs):
+    info = {
+        "results": [PostInfo(post_vo, minimal, **kwargs) for post_vo in post_vos],
+        "total_count": total_count,
+    }
+
+    if next_token and _HAS_NEXT_TOKEN:
+        info["next_token"] = next_token
+
+    return post_pb2.PostsInfo(**info)
+
+
+def _make_options_struct(options: dict):
+    # Posts only use a few option combinations, so their Structs are shared.
+    options = options or {}
+
+    try:
+        cache_key = tuple(sorted(options.items()))
+        if struct := _OPTIONS_STRUCTS.get(cache_key):
+            return struct
+    except TypeError:
+        return change_struct_type(options)
+
+    struct = change_struct_type(options)
+
+    if len(_OPTIONS_STRUCTS) < 128:
+        _OPTIONS_STRUCTS[cache_key] = struct
+
+    return struct
+
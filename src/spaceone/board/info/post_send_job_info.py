@@ -0,0 +1,39 @@
+from spaceone.api.board.v1 import post_pb2
+from spaceone.core.pygrpc.message_type import change_struct_type
+from spaceone.core import utils
+
+from spaceone.board.model.post_send_job_model import PostSendJob
+
+__all__ = ["PostSendJobInfo"]
+
+_HAS_POST_SEND_JOB_INFO = (
+    "PostSendJobInfo" in post_pb2.DESCRIPTOR.message_types_by_name
+)
+
+
+def PostSendJobInfo(post_send_job_vo: PostSendJob):
+    sent_count = post_send_job_vo.sent_count or 0
+    failed_count = post_send_job_vo.failed_count or 0
+
+    info = {
+        "job_id": post_send_job_vo.job_id,
+        "post_id": post_send_job_vo.post_id,
+        "state": post_send_job_vo.state,
+        "total_count": post_send_job_vo.total_count,
+        "sent_count": sent_count,
+        "failed_count": failed_count,
+        "pending_count": max(
+            post_send_job_vo.total_count - sent_count - failed_count, 0
+        ),
+        "error_message": post_send_job_vo.error_message,
+        "resource_group": post_send_job_vo.resource_group,
+        "domain_id": post_send_job_vo.domain_id,
+        "created_at": utils.datetime_to_iso8601(post_send_job_vo.created_at),
+        "finished_at": utils.datetime_to_iso8601(post_send_job_vo.finished_at),
+    }
+
+    # spaceone-api versions without PostSendJobInfo get the job as a Struct.
+    if _HAS_POST_SEND_JOB_INFO:
+        return post_pb2.PostSendJobInfo(**info)
+
+    return change_struct_type(info)
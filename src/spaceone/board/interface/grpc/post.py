@@ -3,6 +3,12 @@ from spaceone.core.pygrpc import BaseAPI
 from spaceone.board.service.post_service import PostService
 from spaceone.board.info.post_info import *
 from spaceone.board.info.common_info import *
+from spaceone.board.info.post_send_job_info import *
+
+# Post.send answers with its send job from the spaceone-api version that
+# declares PostSendJobInfo as its response; older versions return Empty.
+_SEND_METHOD = post_pb2.DESCRIPTOR.services_by_name["Post"].methods_by_name["send"]
+_SEND_RETURNS_JOB = _SEND_METHOD.output_type.name == "PostSendJobInfo"
 
 
 class Post(BaseAPI, post_pb2_grpc.PostServicer):
@@ -25,9 +31,21 @@ class Post(BaseAPI, post_pb2_grpc.PostServicer):
         params, metadata = self.parse_request(request, context)
 
         with self.locator.get_service(PostService, metadata) as post_service:
-            post_service.send(params)
+            post_send_job_vo = post_service.send(params)
+
+            if _SEND_RETURNS_JOB:
+                return self.locator.get_info(PostSendJobInfo, post_send_job_vo)
+
             return self.locator.get_info(EmptyInfo)
 
+    def get_send_status(self, request, context):
+        params, metadata = self.parse_request(request, context)
+
+        with self.locator.get_service(PostService, metadata) as post_service:
+            return self.locator.get_info(
+                PostSendJobInfo, post_service.get_send_status(params)
+            )
+
     def delete(self, request, context):
         params, metadata = self.parse_request(request, context)
 
@@ -46,9 +64,13 @@ class Post(BaseAPI, post_pb2_grpc.PostServicer):
         params, metadata = self.parse_request(request, context)
 
         with self.locator.get_service(PostService, metadata) as post_service:
-            post_vos, total_count = post_service.list(params)
+            post_vos, total_count, next_token = post_service.list(params)
             return self.locator.get_info(
-                PostsInfo, post_vos, total_count, minimal=self.get_minimal(params)
+                PostsInfo,
+                post_vos,
+                total_count,
+                next_token=next_token,
+                minimal=self.get_minimal(params),
             )
 
     def stat(self, request, context):
@@ -0,0 +1,386 @@
+"""Two-tier cache: an in-process LRU (L1) in front of the shared cache (L2)
+
+The functions mirror spaceone.core.cache, so managers only change their
+import. Keys whose prefix has a policy in L1_CACHE_POLICIES are also kept
+in L1 for at most the policy's expire seconds; all other keys, such as the
+notice email send lock, always go to the shared cache.
+
+L1 is per process and is only invalidated by deletes made in the same
+process, so the L1 expire of a prefix is the staleness its readers accept
+after a change made by another process. Cached values are shared between
+callers and must not be mutated.
+
+get_or_load coalesces concurrent misses of a key in this process into one
+load (single-flight) and, when CACHE_EARLY_REFRESH is on, refreshes hot
+keys shortly before they expire so that they never miss all at once.
+"""
+
+import fnmatch
+import functools
+import inspect
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Union
+
+from spaceone.core import cache as _shared_cache
+from spaceone.core import config
+
+__all__ = [
+    "is_set",
+    "get",
+    "set",
+    "delete",
+    "delete_pattern",
+    "cacheable",
+    "get_or_load",
+    "single_flight",
+    "get_stats",
+    "clear_local_cache",
+]
+
+
+class _LocalCache(object):
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, expire: float) -> None:
+        max_size = config.get_global("L1_CACHE_MAX_SIZE", 10000)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + expire, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        with self._lock:
+            for key in fnmatch.filter(list(self._entries), pattern):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class _CacheStats(object):
+    def __init__(self):
+        self._counts = {}
+        self._lock = threading.Lock()
+
+    def increase(self, prefix: str, name: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(
+                prefix, {"l1_hit": 0, "l2_hit": 0, "miss": 0}
+            )
+            counts[name] += 1
+
+    def get(self) -> dict:
+        with self._lock:
+            return {prefix: dict(counts) for prefix, counts in self._counts.items()}
+
+
+class _Call(object):
+    def __init__(self):
+        self.event = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class _LoadHistory(object):
+    """Remembers when this process loaded a key and how long the load took"""
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Union[tuple, None]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, expires_at: float, load_seconds: float) -> None:
+        max_size = config.get_global("L1_CACHE_MAX_SIZE", 10000)
+
+        with self._lock:
+            self._entries[key] = (expires_at, load_seconds)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_pattern(self, pattern: str) -> None:
+        with self._lock:
+            for key in fnmatch.filter(list(self._entries), pattern):
+                del self._entries[key]
+
+
+_LOCAL_CACHE = _LocalCache()
+_CACHE_STATS = _CacheStats()
+_LOAD_HISTORY = _LoadHistory()
+_IN_FLIGHT_CALLS = {}
+_IN_FLIGHT_LOCK = threading.Lock()
+
+# L1_CACHE_POLICIES as (prefix, policy) pairs, longest prefix first. Resolved
+# on first use and again after clear_local_cache().
+_POLICIES = None
+
+
+def is_set() -> bool:
+    return _shared_cache.is_set()
+
+
+def get(key: str):
+    prefix, policy = _get_policy(key)
+
+    if policy:
+        if (value := _LOCAL_CACHE.get(key)) is not None:
+            _CACHE_STATS.increase(prefix, "l1_hit")
+            return value
+
+    value = _shared_cache.get(key)
+
+    if value is None:
+        _CACHE_STATS.increase(prefix, "miss")
+        return None
+
+    _CACHE_STATS.increase(prefix, "l2_hit")
+
+    if policy:
+        _LOCAL_CACHE.set(key, value, policy.get("expire", 10))
+
+    return value
+
+
+def set(key: str, value, expire: int = None) -> None:
+    if expire is None:
+        _shared_cache.set(key, value)
+    else:
+        _shared_cache.set(key, value, expire=expire)
+
+    _, policy = _get_policy(key)
+    if policy:
+        l1_expire = policy.get("expire", 10)
+        if expire is not None:
+            l1_expire = min(l1_expire, expire)
+
+        _LOCAL_CACHE.set(key, value, l1_expire)
+
+
+def delete(key: str) -> None:
+    _LOCAL_CACHE.delete(key)
+    _LOAD_HISTORY.delete(key)
+    _shared_cache.delete(key)
+
+
+def delete_pattern(pattern: str) -> None:
+    _LOCAL_CACHE.delete_pattern(pattern)
+    _LOAD_HISTORY.delete_pattern(pattern)
+    _shared_cache.delete_pattern(pattern)
+
+
+def get_or_load(
+    key: str,
+    load_func: Callable,
+    expire: Union[int, Callable, None] = None,
+):
+    """Get a value, loading and caching it once per key on a miss
+
+    Args:
+        key (str): cache key
+        load_func (Callable): returns the value; None is returned but not cached
+        expire (int | Callable): seconds, or a function of the loaded value
+
+    Returns:
+        value
+    """
+
+    if not is_set():
+        return single_flight(key, load_func)
+
+    value = get(key)
+
+    if value is None:
+        return single_flight(key, lambda: _load_and_set(key, load_func, expire))
+
+    if _should_refresh_early(key):
+        # Only one caller refreshes; the others keep using the cached value.
+        with _IN_FLIGHT_LOCK:
+            in_flight = key in _IN_FLIGHT_CALLS
+
+        if not in_flight:
+            try:
+                return single_flight(
+                    key, lambda: _load_and_set(key, load_func, expire)
+                )
+            except Exception:
+                # The cached value is still valid, so a failed refresh is not
+                # the caller's problem.
+                return value
+
+    return value
+
+
+def single_flight(key: str, func: Callable):
+    """Run func once for concurrent callers of the same key in this process
+
+    Callers that arrive while a call is in flight wait for its result (or
+    error). If it takes longer than SINGLE_FLIGHT_TIMEOUT seconds, they
+    call func themselves.
+    """
+
+    with _IN_FLIGHT_LOCK:
+        call = _IN_FLIGHT_CALLS.get(key)
+        is_leader = call is None
+
+        if is_leader:
+            call = _Call()
+            _IN_FLIGHT_CALLS[key] = call
+
+    if not is_leader:
+        if call.event.wait(config.get_global("SINGLE_FLIGHT_TIMEOUT", 30)):
+            if call.error is not None:
+                raise call.error
+
+            return call.value
+
+        return func()
+
+    try:
+        call.value = func()
+        return call.value
+    except Exception as e:
+        call.error = e
+        raise e
+    finally:
+        with _IN_FLIGHT_LOCK:
+            _IN_FLIGHT_CALLS.pop(key, None)
+
+        call.event.set()
+
+
+def cacheable(key: str, expire: int = None):
+    """Same as spaceone.core.cache.cacheable, reading through L1 and L2"""
+
+    def wrapper(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapped_func(*args, **kwargs):
+            if not is_set():
+                return func(*args, **kwargs)
+
+            bound_args = signature.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            cache_key = key.format(**bound_args.arguments)
+
+            return get_or_load(
+                cache_key, lambda: func(*args, **kwargs), expire=expire
+            )
+
+        return wrapped_func
+
+    return wrapper
+
+
+def get_stats() -> dict:
+    """Return hit/miss counters per key prefix
+
+    Returns:
+        stats (dict): {
+            'key prefix': {'l1_hit': 'int', 'l2_hit': 'int', 'miss': 'int'}
+        }
+    """
+
+    return _CACHE_STATS.get()
+
+
+def clear_local_cache() -> None:
+    """Drop L1 entries and re-read L1_CACHE_POLICIES on the next access"""
+
+    global _POLICIES
+
+    _LOCAL_CACHE.clear()
+    _POLICIES = None
+
+
+def _load_and_set(key: str, load_func: Callable, expire: Union[int, Callable, None]):
+    started_at = time.monotonic()
+    value = load_func()
+    load_seconds = time.monotonic() - started_at
+
+    if value is None:
+        return None
+
+    if callable(expire):
+        expire = expire(value)
+
+    set(key, value, expire=expire)
+
+    if expire is not None:
+        _LOAD_HISTORY.set(key, time.monotonic() + expire, load_seconds)
+
+    return value
+
+
+def _should_refresh_early(key: str) -> bool:
+    # Probabilistic early expiration: the closer the key is to its expiry
+    # and the slower it is to load, the likelier a caller refreshes it now.
+    if not config.get_global("CACHE_EARLY_REFRESH", False):
+        return False
+
+    if (history := _LOAD_HISTORY.get(key)) is None:
+        return False
+
+    expires_at, load_seconds = history
+    beta = config.get_global("CACHE_EARLY_REFRESH_BETA", 1.0)
+    gap = -load_seconds * beta * math.log(1.0 - random.random())
+
+    return time.monotonic() + gap >= expires_at
+
+
+def _get_policies() -> list:
+    global _POLICIES
+
+    if (policies := _POLICIES) is None:
+        l1_cache_policies = config.get_global("L1_CACHE_POLICIES", {})
+        policies = sorted(
+            l1_cache_policies.items(), key=lambda item: len(item[0]), reverse=True
+        )
+        _POLICIES = policies
+
+    return policies
+
+
+def _get_policy(key: str) -> tuple:
+    for prefix, policy in _get_policies():
+        if key.startswith(prefix):
+            return prefix, policy
+
+    # Counters of keys without a policy are grouped by their first two parts.
+    return ":".join(key.split(":")[:2]), None
@@ -0,0 +1,78 @@
+import html
+import re
+from html.parser import HTMLParser
+from typing import Tuple
+
+import markdown
+
+from spaceone.board.lib.html_sanitizer import sanitize_html
+
+__all__ = ["render_contents"]
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def render_contents(
+    contents: str, contents_type: str, excerpt_length: int = 200
+) -> Tuple[str, str]:
+    """Render stored post contents to HTML and a plaintext excerpt
+
+    The contents are the html-escaped source saved by the post service, so
+    markdown and plaintext never produce tags the writer typed in. HTML
+    contents are restored as written. The rendered HTML of every contents
+    type then goes through the allowlist sanitizer.
+
+    Returns:
+        html_contents (str)
+        excerpt (str)
+    """
+
+    if contents_type == "html":
+        html_contents = html.unescape(contents)
+    elif contents_type == "plaintext":
+        html_contents = "<p>" + contents.replace("\n", "<br />\n") + "</p>"
+    else:
+        html_contents = markdown.markdown(contents, extensions=["nl2br"])
+
+    html_contents = sanitize_html(html_contents)
+
+    return html_contents, _make_excerpt(html_contents, excerpt_length)
+
+
+def _make_excerpt(html_contents: str, excerpt_length: int) -> str:
+    parser = _TextExtractor()
+    parser.feed(html_contents)
+    parser.close()
+
+    text = _WHITESPACE_PATTERN.sub(" ", "".join(parser.texts)).strip()
+
+    if len(text) > excerpt_length:
+        text = text[: excerpt_length - 1].rstrip() + "…"
+
+    return text
+
+
+class _TextExtractor(HTMLParser):
+    _BLOCK_TAGS = {"p", "br", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6"}
+    _SKIP_TAGS = {"script", "style"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.texts = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self._BLOCK_TAGS:
+            self.texts.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS:
+            self._skip_depth = max(self._skip_depth - 1, 0)
+        elif tag in self._BLOCK_TAGS:
+            self.texts.append(" ")
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.texts.append(data)
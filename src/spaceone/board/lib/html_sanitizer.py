@@ -0,0 +1,169 @@
+import html
+import re
+from html.parser import HTMLParser
+
+__all__ = ["sanitize_html"]
+
+_ALLOWED_TAGS = {
+    "a",
+    "abbr",
+    "b",
+    "blockquote",
+    "br",
+    "code",
+    "del",
+    "div",
+    "em",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "hr",
+    "i",
+    "img",
+    "li",
+    "ol",
+    "p",
+    "pre",
+    "s",
+    "span",
+    "strong",
+    "sub",
+    "sup",
+    "table",
+    "tbody",
+    "td",
+    "tfoot",
+    "th",
+    "thead",
+    "tr",
+    "u",
+    "ul",
+}
+
+_VOID_TAGS = {"br", "hr", "img"}
+
+# Tags whose contents are dropped along with them, not kept as text.
+_DROP_CONTENT_TAGS = {
+    "embed",
+    "iframe",
+    "math",
+    "noscript",
+    "object",
+    "script",
+    "select",
+    "style",
+    "svg",
+    "template",
+    "textarea",
+    "title",
+}
+
+_ALLOWED_ATTRIBUTES = {
+    "a": {"href", "title"},
+    "abbr": {"title"},
+    "code": {"class"},
+    "img": {"src", "alt", "title", "width", "height"},
+    "ol": {"start"},
+    "td": {"colspan", "rowspan", "align"},
+    "th": {"colspan", "rowspan", "align"},
+}
+
+_URL_ATTRIBUTES = {"href", "src"}
+_ALLOWED_URL_SCHEMES = {"http", "https", "mailto"}
+
+# Browsers ignore whitespace and control characters inside a URL scheme.
+_URL_IGNORED_CHARS_PATTERN = re.compile(r"[\x00-\x20\x7f]+")
+
+
+def sanitize_html(html_contents: str) -> str:
+    """Keep only allowlisted tags, attributes and URL schemes of HTML
+
+    Character references are decoded before attributes are checked, so
+    encoded schemes such as "jav&#x61;script:" are caught. Event handler
+    and style attributes are never allowed, and unclosed tags are closed.
+    """
+
+    sanitizer = _HTMLSanitizer()
+    sanitizer.feed(html_contents)
+    sanitizer.close()
+
+    return "".join(sanitizer.parts)
+
+
+def _is_safe_url(url: str) -> bool:
+    url = _URL_IGNORED_CHARS_PATTERN.sub("", url)
+    scheme, separator, _ = url.partition(":")
+
+    # No scheme, or a colon after the path started: a relative URL.
+    if not separator or any(char in scheme for char in "/?#"):
+        return True
+
+    return scheme.lower() in _ALLOWED_URL_SCHEMES
+
+
+class _HTMLSanitizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts = []
+        self._open_tags = []
+        self._drop_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _DROP_CONTENT_TAGS:
+            self._drop_depth += 1
+            return
+
+        if self._drop_depth or tag not in _ALLOWED_TAGS:
+            return
+
+        attributes = self._make_attributes(tag, attrs)
+
+        if tag in _VOID_TAGS:
+            self.parts.append(f"<{tag}{attributes} />")
+        else:
+            self.parts.append(f"<{tag}{attributes}>")
+            self._open_tags.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in _DROP_CONTENT_TAGS:
+            self._drop_depth = max(self._drop_depth - 1, 0)
+            return
+
+        if self._drop_depth or tag not in self._open_tags:
+            return
+
+        while self._open_tags:
+            open_tag = self._open_tags.pop()
+            self.parts.append(f"</{open_tag}>")
+
+            if open_tag == tag:
+                break
+
+    def handle_data(self, data):
+        if not self._drop_depth:
+            self.parts.append(html.escape(data, quote=False))
+
+    def close(self):
+        super().close()
+
+        while self._open_tags:
+            self.parts.append(f"</{self._open_tags.pop()}>")
+
+    @staticmethod
+    def _make_attributes(tag: str, attrs: list) -> str:
+        allowed_attributes = _ALLOWED_ATTRIBUTES.get(tag, ())
+
+        attributes = []
+        for name, value in attrs:
+            if name not in allowed_attributes or value is None:
+                continue
+
+            if name in _URL_ATTRIBUTES and not _is_safe_url(value):
+                continue
+
+            attributes.append(f' {name}="{html.escape(value, quote=True)}"')
+
+        return "".join(attributes)
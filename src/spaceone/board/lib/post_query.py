@@ -0,0 +1,86 @@
+"""Query helpers shared by the post managers
+
+The post, post count and notice feed managers answer some queries without
+MongoModel.query. They parse the same eq/in filters, scope their cache
+keys the same way and cache posts in the same JSON form.
+"""
+
+from datetime import datetime
+from typing import Union
+
+from spaceone.board.model.post_model import Post
+
+__all__ = ["get_filter_conditions", "make_scope_key", "dump_post", "load_post"]
+
+_POST_DATETIME_FIELDS = ["created_at", "updated_at"]
+
+
+def get_filter_conditions(
+    filters: list, filter_keys: list, change_query_keys: dict = None
+) -> Union[dict, None]:
+    """Return the filter as {key: allowed values}, or None if it has other keys
+    or operators than eq and in
+
+    Conditions on the same key are ANDed, so a key repeated by the caller
+    and by an injected filter such as domain_id keeps the common values.
+    """
+
+    change_query_keys = change_query_keys or {}
+
+    conditions = {}
+    for condition in filters:
+        key = condition.get("k", condition.get("key"))
+        value = condition.get("v", condition.get("value"))
+        operator = condition.get("o", condition.get("operator", "eq"))
+
+        key = change_query_keys.get(key, key)
+
+        if key not in filter_keys:
+            return None
+
+        if operator == "eq":
+            values = [value]
+        elif operator == "in" and isinstance(value, list):
+            values = value
+        else:
+            return None
+
+        if key in conditions:
+            values = [v for v in conditions[key] if v in values]
+
+        conditions[key] = values
+
+    return conditions
+
+
+def make_scope_key(value: Union[str, list, None]) -> str:
+    if value is None:
+        return "-"
+    elif isinstance(value, list):
+        return ",".join(sorted(value))
+    else:
+        return value
+
+
+def dump_post(post_vo: Post) -> dict:
+    # The shared cache stores values as JSON, so the document is cached
+    # with its ObjectId and datetimes as strings.
+    post_data = post_vo.to_mongo().to_dict()
+    post_data["_id"] = str(post_data["_id"])
+
+    for key in _POST_DATETIME_FIELDS:
+        if isinstance(post_data.get(key), datetime):
+            post_data[key] = post_data[key].isoformat()
+
+    return post_data
+
+
+def load_post(post_model: Post, post_data: dict) -> Post:
+    # Cached values are shared between callers, so they are copied first.
+    post_data = dict(post_data)
+
+    for key in _POST_DATETIME_FIELDS:
+        if isinstance(post_data.get(key), str):
+            post_data[key] = datetime.fromisoformat(post_data[key])
+
+    return post_model._from_son(post_data, created=False)
@@ -0,0 +1,69 @@
+"""Bounded cache of decoded (unverified) JWT claims
+
+Managers read claims such as "typ" of the transaction token every time
+they are built. The claims of a token never change, so they are decoded
+once and kept, keyed by a hash of the token, until the token's exp or
+TOKEN_CLAIMS_CACHE_EXPIRE, whichever comes first.
+
+The signature is not verified here; tokens are verified by the
+authentication handler before any manager reads them.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from spaceone.core import config
+from spaceone.core.auth.jwt.jwt_util import JWTUtil
+
+__all__ = ["get_token_claims", "get_value_from_token"]
+
+_TOKEN_CLAIMS = OrderedDict()
+_TOKEN_CLAIMS_LOCK = threading.Lock()
+
+
+def get_token_claims(token: str) -> dict:
+    """Return the decoded claims of token; callers must not mutate them"""
+
+    if not token:
+        return {}
+
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    now = time.time()
+
+    with _TOKEN_CLAIMS_LOCK:
+        if entry := _TOKEN_CLAIMS.get(token_hash):
+            expires_at, claims = entry
+            if expires_at > now:
+                _TOKEN_CLAIMS.move_to_end(token_hash)
+                return claims
+
+            del _TOKEN_CLAIMS[token_hash]
+
+    try:
+        claims = JWTUtil.unverified_decode(token)
+    except Exception:
+        # Like JWTUtil.get_value_from_token, a token that cannot be decoded
+        # has no claims. It is not cached, so a later call decodes it again.
+        return {}
+
+    expires_at = now + config.get_global("TOKEN_CLAIMS_CACHE_EXPIRE", 300)
+    if exp := claims.get("exp"):
+        expires_at = min(expires_at, exp)
+
+    if expires_at > now:
+        max_size = config.get_global("TOKEN_CLAIMS_CACHE_MAX_SIZE", 1000)
+
+        with _TOKEN_CLAIMS_LOCK:
+            _TOKEN_CLAIMS[token_hash] = (expires_at, claims)
+            _TOKEN_CLAIMS.move_to_end(token_hash)
+
+            while len(_TOKEN_CLAIMS) > max_size:
+                _TOKEN_CLAIMS.popitem(last=False)
+
+    return claims
+
+
+def get_value_from_token(token: str, key: str, default=None):
+    return get_token_claims(token).get(key, default)
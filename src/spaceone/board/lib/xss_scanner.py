@@ -0,0 +1,161 @@
+import re
+
+__all__ = ["has_xss_pattern"]
+
+_EVENT_HANDLERS = (
+    "error|load|mouseover|click|mouseout|keypress|keydown|keyup|submit|focus|"
+    "blur|change|reset|select|abort|dblclick|unload|beforeunload"
+)
+
+# Every alternative is wrapped in a lookahead, so the scanner reports the
+# token at each position without consuming it and tokens never hide each
+# other. Variable parts are either bounded or a run of one character class
+# after a fixed literal, which keeps a scan linear in the contents length.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?=(
+        </script>
+      | <script\b
+      | <!--
+      | <(?:img|iframe|embed|object|link|meta|base)
+      | javascript:
+      | vbscript:
+      | data:
+      | @import
+      | document\.(?:location|cookie|write)
+      | \\x[0-9a-f]{2}
+      | \\u[0-9a-f]{4}
+      | (?:expression|url)\s*\(
+      | &\{
+      | src[\r\n]*=
+      | href=
+      | content=
+      | on(?:\w{1,32}=(?:["']|\w{1,64}\()|%s)
+    ))
+    """
+    % _EVENT_HANDLERS,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+_REJECT_TOKEN_PREFIXES = (
+    "javascript:",
+    "vbscript:",
+    "data:",
+    "@import",
+    "document.",
+    "\\x",
+    "\\u",
+    "expression",
+    "url",
+)
+
+_ON_ATTRIBUTE_PATTERN = re.compile(r"on\w{1,32}=(?:(\")|(')|\w{1,64}(\())", re.IGNORECASE)
+_EVENT_HANDLER_PATTERN = re.compile(rf"on(?:{_EVENT_HANDLERS})\b", re.IGNORECASE)
+_ERROR_OR_LOAD_PATTERN = re.compile(r"on(?:error|load)", re.IGNORECASE)
+_ERROR_OR_LOAD_WORD_PATTERN = re.compile(r"on(?:error|load)\b", re.IGNORECASE)
+_WORD_CHAR_PATTERN = re.compile(r"\w")
+
+
+def has_xss_pattern(contents: str) -> bool:
+    """Check contents for script injection patterns in a single linear scan
+
+    Rejects <script> blocks, script/data urls, inline event handlers, CSS
+    expression/url/import attacks, unsafe document access, escaped unicode,
+    markup hidden in HTML comments and embedding tags combined with
+    src/href/content or onerror/onload attributes.
+    """
+
+    last_double_quote = contents.rfind('"')
+    last_single_quote = contents.rfind("'")
+    last_close_paren = contents.rfind(")")
+    last_close_brace = contents.rfind("}")
+    last_tag_close = contents.rfind(">")
+    next_tag_close = -1
+
+    # Positions of the last "<" and ">" before tag_scan_pos, advanced
+    # incrementally so every character is searched at most once.
+    tag_scan_pos = 0
+    tag_open_pos = -1
+    tag_close_pos = -1
+
+    script_opened = False
+    src_found = False
+    embed_tag_found = False
+    embed_attribute_found = False
+
+    for match in _TOKEN_PATTERN.finditer(contents):
+        token = match.group(1).lower()
+        start = match.start()
+        end = start + len(token)
+
+        if token.startswith("on"):
+            on_attribute = _ON_ATTRIBUTE_PATTERN.match(contents, start)
+            if on_attribute:
+                if on_attribute.group(1) and last_double_quote >= on_attribute.end():
+                    return True
+                if on_attribute.group(2) and last_single_quote >= on_attribute.end():
+                    return True
+                if on_attribute.group(3) and last_close_paren >= on_attribute.end():
+                    return True
+
+            if _ERROR_OR_LOAD_PATTERN.match(contents, start):
+                embed_attribute_found = True
+
+            if start > 0 and _WORD_CHAR_PATTERN.match(contents, start - 1):
+                continue
+
+            if _EVENT_HANDLER_PATTERN.match(contents, start):
+                # Matches <[^>]*\bon...\b[^>]*> : the handler is inside an
+                # unclosed "<" and a ">" follows it somewhere.
+                tag_open_pos = max(tag_open_pos, contents.rfind("<", tag_scan_pos, start))
+                tag_close_pos = max(tag_close_pos, contents.rfind(">", tag_scan_pos, start))
+                tag_scan_pos = start
+
+                if tag_open_pos > tag_close_pos and last_tag_close > start:
+                    return True
+
+            if src_found and _ERROR_OR_LOAD_WORD_PATTERN.match(contents, start):
+                return True
+
+        elif token[0] == "<":
+            if token == "</script>":
+                if script_opened:
+                    return True
+            elif token == "<script":
+                script_opened = True
+            elif token == "<!--":
+                # Matches <!--[^>]*--> : the first ">" after the comment
+                # opener must close it. The lookup is shared by every opener
+                # before that ">", so repeated openers stay linear.
+                if next_tag_close < end:
+                    next_tag_close = contents.find(">", end)
+                    if next_tag_close < 0:
+                        next_tag_close = len(contents)
+
+                if (
+                    next_tag_close < len(contents)
+                    and next_tag_close >= end + 2
+                    and contents[next_tag_close - 2 : next_tag_close] == "--"
+                ):
+                    return True
+            else:
+                embed_tag_found = True
+
+        elif token.startswith(_REJECT_TOKEN_PREFIXES):
+            return True
+
+        elif token == "&{":
+            if last_close_brace >= end:
+                return True
+
+        elif token.startswith("src"):
+            src_found = True
+
+            if token == "src=":
+                embed_attribute_found = True
+
+        else:
+            # href= or content=
+            embed_attribute_found = True
+
+    return embed_tag_found and embed_attribute_found
@@ -1,10 +1,11 @@
 import logging
 
-from spaceone.core import cache
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
-from spaceone.core.auth.jwt.jwt_util import JWTUtil
+
+from spaceone.board.lib import cache
+from spaceone.board.lib.token_claims import get_value_from_token
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,25 +13,78 @@ _LOGGER = logging.getLogger(__name__)
 class ConfigManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        token = self.transaction.get_meta("token")
-        self.token_type = JWTUtil.get_value_from_token(token, "typ")
+        # get_domain_config is also called from recipient resolver threads,
+        # where the thread-local transaction has no token.
+        self.token = self.transaction.get_meta("token")
+        self.token_type = get_value_from_token(self.token, "typ")
         self.config_conn: SpaceConnector = self.locator.get_connector(
             SpaceConnector, service="config"
         )
 
-    @cache.cacheable(
-        key="board:domain-config-settings:{domain_id}:settings", expire=300
-    )
-    def get_domain_config(self, domain_id: str):
-        if self.token_type == "SYSTEM_TOKEN":
-            response = self.config_conn.dispatch(
-                "DomainConfig.get",
-                {"name": "settings"},
-                x_domain_id=domain_id,
-            )
-        else:
-            response = self.config_conn.dispatch(
-                "DomainConfig.get",
-                {"name": "settings"},
-            )
+    def get_domain_config(self, domain_id: str) -> dict:
+        """Get the settings domain config, or {} if the domain has none
+
+        Missing configs are cached for NEGATIVE_CACHE_EXPIRE seconds, so
+        later sends skip the failing DomainConfig.get call.
+        """
+
+        return cache.get_or_load(
+            _make_domain_config_cache_key(domain_id),
+            lambda: self._get_domain_config(domain_id),
+            expire=_get_domain_config_expire,
+        )
+
+    def _get_domain_config(self, domain_id: str) -> dict:
+        try:
+            if self.token_type == "SYSTEM_TOKEN":
+                response = self.config_conn.dispatch(
+                    "DomainConfig.get",
+                    {"name": "settings"},
+                    token=self.token,
+                    x_domain_id=domain_id,
+                )
+            else:
+                response = self.config_conn.dispatch(
+                    "DomainConfig.get",
+                    {"name": "settings"},
+                    token=self.token,
+                )
+        except Exception as e:
+            if not _is_not_found_error(e):
+                raise e
+
+            _LOGGER.debug(f"[get_domain_config] {domain_id} domain config not found.")
+            return {}
+
         return response
+
+    def list_domain_configs(self, params: dict) -> dict:
+        system_token = config.get_global("TOKEN")
+        return self.config_conn.dispatch(
+            "DomainConfig.list", params, token=system_token
+        )
+
+    @staticmethod
+    def set_domain_config_cache(domain_id: str, domain_config_info: dict) -> None:
+        if cache.is_set():
+            cache.set(
+                _make_domain_config_cache_key(domain_id),
+                domain_config_info,
+                expire=_get_domain_config_expire(domain_config_info),
+            )
+
+
+def _make_domain_config_cache_key(domain_id: str) -> str:
+    return f"board:domain-config-settings:{domain_id}:settings"
+
+
+def _get_domain_config_expire(domain_config_info: dict) -> int:
+    if domain_config_info:
+        return 300
+
+    return config.get_global("NEGATIVE_CACHE_EXPIRE", 300)
+
+
+def _is_not_found_error(error: Exception) -> bool:
+    error_code = getattr(error, "error_code", None)
+    return error_code == "ERROR_NOT_FOUND" or "ERROR_NOT_FOUND" in str(error)
@@ -1,7 +1,9 @@
+import functools
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
 
-import markdown
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
@@ -23,19 +25,12 @@ class EmailManager(BaseManager):
         self.smtp_connector = SMTPConnector()
 
     def send_notification_email(
-        self, email: str, language: str, post_contents: str, post_title: str
+        self, email: str, language: str, html_contents: str, post_title: str
     ):
         try:
-            html_contents = markdown.markdown(post_contents, extensions=["nl2br"])
-
-            service_name = self._get_service_name()
-            template = JINJA_ENV.get_template(f"notice_email_{language}.html")
-            email_contents = template.render(
-                markdown_html=html_contents,
-                service_name=service_name,
-                notice_title=post_title,
+            subject, email_contents = _render_notification_email(
+                language, html_contents, post_title, self._get_service_name()
             )
-            subject = f"[{service_name}] {post_title}"
 
             self.smtp_connector.send_email(email, subject, email_contents)
         except Exception as e:
@@ -44,6 +39,92 @@ class EmailManager(BaseManager):
                 exc_info=True,
             )
 
+    def send_notification_emails(
+        self, emails: list, language: str, html_contents: str, post_title: str
+    ) -> dict:
+        """Send a notice email to many recipients using the configured delivery mode
+
+        Returns:
+            refused_emails (dict): {email: (smtp_code, smtp_message)}
+        """
+
+        delivery_mode = config.get_global("EMAIL_DELIVERY_MODE", "SINGLE")
+
+        if delivery_mode in ["BCC", "RCPT"]:
+            batch_size = max(int(config.get_global("EMAIL_BATCH_SIZE", 50)), 1)
+        else:
+            batch_size = 1
+
+        refused_emails = {}
+        concurrency = max(int(config.get_global("EMAIL_SEND_CONCURRENCY", 1)), 1)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                executor.submit(
+                    self._send_batch_notification_email,
+                    emails[idx : idx + batch_size],
+                    language,
+                    html_contents,
+                    post_title,
+                    delivery_mode == "BCC",
+                )
+                for idx in range(0, len(emails), batch_size)
+            ]
+
+            for future in futures:
+                refused_emails.update(future.result())
+
+        if refused_emails:
+            _LOGGER.debug(
+                f"[send_notification_emails] refused email count: {len(refused_emails)}"
+            )
+
+        return refused_emails
+
+    def _send_batch_notification_email(
+        self,
+        emails: list,
+        language: str,
+        html_contents: str,
+        post_title: str,
+        bcc: bool,
+    ) -> dict:
+        try:
+            subject, email_contents = _render_notification_email(
+                language, html_contents, post_title, self._get_service_name()
+            )
+
+            return (
+                self.smtp_connector.send_email(
+                    emails, subject, email_contents, bcc=bcc
+                )
+                or {}
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_send_batch_notification_email] failed to send email to {len(emails)} recipients {e}",
+                exc_info=True,
+            )
+            return {email: (None, str(e)) for email in emails}
+
     @staticmethod
     def _get_service_name():
         return config.get_global("EMAIL_SERVICE_NAME")
+
+
+@functools.lru_cache(maxsize=32)
+def _render_notification_email(
+    language: str, html_contents: str, post_title: str, service_name: str
+) -> Tuple[str, str]:
+    # The rendered email only depends on these arguments, so every recipient of
+    # the same post and language shares one render. Only strings are cached:
+    # a MIME part is a mutable message, so each send builds its own.
+    template = JINJA_ENV.get_template(f"notice_email_{language}.html")
+    email_contents = template.render(
+        markdown_html=html_contents,
+        service_name=service_name,
+        notice_title=post_title,
+    )
+    subject = f"[{service_name}] {post_title}"
+
+    return subject, email_contents
@@ -1,34 +1,132 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
 
-from spaceone.core import cache
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 
+from spaceone.board.lib import cache
+
 _LOGGER = logging.getLogger(__name__)
 
 
 class FileManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # Calls of _dispatch_concurrently run in pool threads without the
+        # thread-local transaction, so every call passes the token itself.
+        self.token = self.transaction.get_meta("token")
         self.file_manager_connector: SpaceConnector = self.locator.get_connector(
             SpaceConnector, service="file_manager"
         )
 
     def get_file(self, file_id: str ) -> dict:
-        return self.file_manager_connector.dispatch("File.get", {"file_id": file_id})
+        return cache.get_or_load(
+            f"board:file:{file_id}",
+            lambda: self.file_manager_connector.dispatch(
+                "File.get", {"file_id": file_id}, token=self.token
+            ),
+            expire=config.get_global("FILE_INFO_CACHE_EXPIRE", 300),
+        )
+
+    def list_files(self, file_ids: list) -> list:
+        files_info = {}
+        file_ids_to_be_fetched = []
+
+        for file_id in file_ids:
+            if file_info := self._get_cached_file_info(file_id):
+                files_info[file_id] = file_info
+            else:
+                file_ids_to_be_fetched.append(file_id)
+
+        if file_ids_to_be_fetched:
+            # Concurrent reads of the same post fetch its files only once.
+            response = cache.single_flight(
+                f"board:file-list:{','.join(sorted(file_ids_to_be_fetched))}",
+                lambda: self.file_manager_connector.dispatch(
+                    "File.list",
+                    {
+                        "query": {
+                            "filter": [
+                                {"k": "file_id", "v": file_ids_to_be_fetched, "o": "in"}
+                            ]
+                        }
+                    },
+                    token=self.token,
+                ),
+            )
+
+            for file_info in response.get("results", []):
+                files_info[file_info["file_id"]] = file_info
+                self._set_cached_file_info(file_info)
+
+        return [files_info[file_id] for file_id in file_ids if file_id in files_info]
 
     def update_file_reference(self, file_id: str, reference: dict) -> dict:
+        self._delete_cached_file_info(file_id)
         return self.file_manager_connector.dispatch(
             "File.update",
             {"file_id": file_id, "reference": reference},
+            token=self.token,
+        )
+
+    def update_file_references(self, file_ids: list, reference: dict) -> list:
+        return self._dispatch_concurrently(
+            lambda file_id: self.update_file_reference(file_id, reference), file_ids
         )
 
     def delete_file(self, file_id: str ) -> None:
-        return self.file_manager_connector.dispatch("File.delete", {"file_id": file_id})
+        self._delete_cached_file_info(file_id)
+        return self.file_manager_connector.dispatch(
+            "File.delete", {"file_id": file_id}, token=self.token
+        )
+
+    def delete_files(self, file_ids: list) -> None:
+        self._dispatch_concurrently(self.delete_file, file_ids)
 
     @cache.cacheable(key="board:file-download-url:{file_id}", expire=600)
-    def get_download_url(self, file_id: str) -> dict:
-        file_info =  self.file_manager_connector.dispatch(
-            "File.get", {"file_id": file_id}
+    def get_download_url(self, file_id: str) -> str:
+        # Read file-manager directly: a url taken from the cached file info
+        # could already be FILE_INFO_CACHE_EXPIRE seconds old.
+        file_info = self.file_manager_connector.dispatch(
+            "File.get", {"file_id": file_id}, token=self.token
         )
-        return file_info.download_url
+        return file_info.get("download_url")
+
+    @staticmethod
+    def _get_cached_file_info(file_id: str) -> Union[dict, None]:
+        if cache.is_set():
+            return cache.get(f"board:file:{file_id}")
+
+        return None
+
+    @staticmethod
+    def _set_cached_file_info(file_info: dict) -> None:
+        # File metadata carries a presigned download url, so it has to expire
+        # before the url does.
+        if cache.is_set():
+            cache.set(
+                f"board:file:{file_info['file_id']}",
+                file_info,
+                expire=config.get_global("FILE_INFO_CACHE_EXPIRE", 300),
+            )
+
+    @staticmethod
+    def _delete_cached_file_info(file_id: str) -> None:
+        if cache.is_set():
+            cache.delete(f"board:file:{file_id}")
+            cache.delete(f"board:file-download-url:{file_id}")
+
+    @staticmethod
+    def _dispatch_concurrently(func, file_ids: list) -> list:
+        # File-manager has no bulk update/delete API, so the calls are issued
+        # in parallel and the first error is raised after all of them finish.
+        if len(file_ids) <= 1:
+            return [func(file_id) for file_id in file_ids]
+
+        concurrency = config.get_global("FILE_MANAGER_CONCURRENCY", 10)
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(file_ids))) as executor:
+            futures = [executor.submit(func, file_id) for file_id in file_ids]
+
+        return [future.result() for future in futures]
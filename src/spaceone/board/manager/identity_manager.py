@@ -1,10 +1,13 @@
+import hashlib
+import json
 import logging
 
-from spaceone.core import cache
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
-from spaceone.core.auth.jwt.jwt_util import JWTUtil
+
+from spaceone.board.lib import cache
+from spaceone.board.lib.token_claims import get_value_from_token
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -12,41 +15,98 @@ _LOGGER = logging.getLogger(__name__)
 class IdentityManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        token = self.transaction.get_meta("token")
-        self.token_type = JWTUtil.get_value_from_token(token, "typ")
+        # Lookups may run in worker threads, which have no transaction, so
+        # the token is taken here and passed to every call.
+        self.token = self.transaction.get_meta("token")
+        self.token_type = get_value_from_token(self.token, "typ")
         self.identity_conn: SpaceConnector = self.locator.get_connector(
             SpaceConnector, service="identity"
         )
 
     def list_users(self, domain_id: str, params: dict) -> dict:
         if self.token_type == "SYSTEM_TOKEN":
-            return self.identity_conn.dispatch(
-                "User.list", params, x_domain_id=domain_id
+            return self._dispatch_with_negative_cache(
+                "User.list", params, domain_id, x_domain_id=domain_id
             )
         else:
-            return self.identity_conn.dispatch("User.list", params)
+            return self._dispatch_with_negative_cache("User.list", params, domain_id)
 
     def list_workspaces(self, params: dict, domain_id: str) -> dict:
         if self.token_type == "SYSTEM_TOKEN":
-            return self.identity_conn.dispatch(
-                "Workspace.list", params, x_domain_id=domain_id
+            return self._dispatch_with_negative_cache(
+                "Workspace.list", params, domain_id, x_domain_id=domain_id
             )
         else:
-            return self.identity_conn.dispatch("Workspace.list", params)
+            return self._dispatch_with_negative_cache(
+                "Workspace.list", params, domain_id
+            )
 
     def list_workspace_users(
         self, params: dict, domain_id: str, workspace_id: str
     ) -> dict:
         if self.token_type == "SYSTEM_TOKEN":
-            return self.identity_conn.dispatch(
+            return self._dispatch_with_negative_cache(
                 "WorkspaceUser.list",
                 params,
+                domain_id,
                 x_domain_id=domain_id,
                 x_workspace_id=workspace_id,
             )
         else:
-            return self.identity_conn.dispatch("WorkspaceUser.list", params)
+            return self._dispatch_with_negative_cache(
+                "WorkspaceUser.list", params, domain_id
+            )
 
     def list_domains(self, params: dict) -> dict:
         system_token = config.get_global("TOKEN")
         return self.identity_conn.dispatch("Domain.list", params, token=system_token)
+
+    def _dispatch_with_negative_cache(
+        self, method: str, params: dict, domain_id: str, **kwargs
+    ) -> dict:
+        """Dispatch a list call, caching empty results for NEGATIVE_CACHE_EXPIRE seconds
+
+        Only the first page is cached, and the key is scoped to the domain
+        and the caller's token. Non-empty results are never cached, so new
+        users and workspaces show up as soon as the lookup stops being empty.
+        """
+
+        if not cache.is_set() or not self._is_first_page(params):
+            return self.identity_conn.dispatch(
+                method, params, token=self.token, **kwargs
+            )
+
+        cache_key = self._make_negative_cache_key(method, params, domain_id, kwargs)
+
+        if response := cache.get(cache_key):
+            return response
+
+        response = self.identity_conn.dispatch(
+            method, params, token=self.token, **kwargs
+        )
+
+        if not response.get("results"):
+            cache.set(
+                cache_key,
+                response,
+                expire=config.get_global("NEGATIVE_CACHE_EXPIRE", 300),
+            )
+
+        return response
+
+    @staticmethod
+    def _is_first_page(params: dict) -> bool:
+        page = params.get("query", {}).get("page") or {}
+        return int(page.get("start", 1)) <= 1
+
+    def _make_negative_cache_key(
+        self, method: str, params: dict, domain_id: str, kwargs: dict
+    ) -> str:
+        token_hash = hashlib.sha256(str(self.token).encode()).hexdigest()
+        request_hash = hashlib.sha256(
+            json.dumps(
+                [token_hash, params, kwargs], sort_keys=True, default=str
+            ).encode()
+        ).hexdigest()
+
+        return f"board:identity-empty:{domain_id}:{method}:{request_hash}"
@@ -0,0 +1,155 @@
+import logging
+from typing import Tuple, Union
+
+from mongoengine import Q
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.board.lib import cache
+from spaceone.board.lib.post_query import (
+    dump_post,
+    get_filter_conditions,
+    load_post,
+    make_scope_key,
+)
+from spaceone.board.model.post_model import Post
+
+_LOGGER = logging.getLogger(__name__)
+
+_NOTICE_FEED_OPTIONS = ["is_popup", "is_pinned"]
+_NOTICE_FEED_FILTER_KEYS = [
+    "domain_id",
+    "workspaces",
+    "board_type",
+    "options.is_popup",
+    "options.is_pinned",
+]
+_NOTICE_FEED_QUERY_KEYS = ["filter", "minimal", "only", "page", "sort"]
+
+
+class NoticeFeedManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.post_model: Post = self.locator.get_model(Post)
+
+    def list_posts_from_notice_feed(
+        self, query: dict
+    ) -> Union[Tuple[list, int], None]:
+        """List popup or pinned posts from the cached feed of their scope
+
+        Returns None for queries the feed cannot serve.
+        """
+
+        if (conditions := self._get_notice_feed_conditions(query)) is None:
+            return None
+
+        post_data_list = self._get_notice_feed(
+            conditions.pop("domain_id"), conditions.pop("workspaces", None)
+        )
+
+        post_vos = []
+        for post_data in post_data_list:
+            for key, values in conditions.items():
+                if key.startswith("options."):
+                    value = (post_data.get("options") or {}).get(key[8:])
+                else:
+                    value = post_data.get(key)
+
+                if value not in values:
+                    break
+            else:
+                post_vos.append(post_data)
+
+        total_count = len(post_vos)
+
+        if page := query.get("page"):
+            start = max(page.get("start", 1), 1) - 1
+            if limit := page.get("limit"):
+                post_vos = post_vos[start : start + limit]
+            else:
+                post_vos = post_vos[start:]
+
+        post_vos = [load_post(self.post_model, post_data) for post_data in post_vos]
+
+        return post_vos, total_count
+
+    @staticmethod
+    def delete_notice_feed_cache_by_vo(
+        post_vo: Post, old_options: dict = None
+    ) -> None:
+        """Drop the cached popup/pinned feeds that can contain this post
+
+        Only posts that are (or were) popup or pinned are part of a feed. A
+        SYSTEM post is visible in every domain, so it drops every feed.
+        """
+
+        if not cache.is_set():
+            return
+
+        options_list = [post_vo.options or {}, old_options or {}]
+        if not any(
+            options.get(key)
+            for options in options_list
+            for key in _NOTICE_FEED_OPTIONS
+        ):
+            return
+
+        if post_vo.domain_id == "*":
+            cache.delete_pattern("board:post-notice-feed:*")
+        else:
+            cache.delete_pattern(f"board:post-notice-feed:*{post_vo.domain_id}*")
+
+    def _get_notice_feed_conditions(self, query: dict) -> Union[dict, None]:
+        """Return the filter as {key: allowed values} if the feed can serve it"""
+
+        if set(query) - set(_NOTICE_FEED_QUERY_KEYS):
+            return None
+
+        if sort := query.get("sort"):
+            if sort != [{"key": "created_at", "desc": True}]:
+                return None
+
+        conditions = get_filter_conditions(
+            query.get("filter", []),
+            _NOTICE_FEED_FILTER_KEYS,
+            self.post_model._meta.get("change_query_keys", {}),
+        )
+
+        if conditions is None or "domain_id" not in conditions:
+            return None
+
+        if not any(
+            conditions.get(f"options.{key}") == [True] for key in _NOTICE_FEED_OPTIONS
+        ):
+            return None
+
+        return conditions
+
+    def _get_notice_feed(
+        self, domain_ids: list, workspace_ids: Union[list, None]
+    ) -> list:
+        cache_key = (
+            f"board:post-notice-feed:"
+            f"{make_scope_key(domain_ids)}:{make_scope_key(workspace_ids)}"
+        )
+
+        post_data_list = cache.get(cache_key)
+        if post_data_list is not None:
+            return post_data_list
+
+        conditions = Q(domain_id__in=domain_ids) & (
+            Q(options__is_popup=True) | Q(options__is_pinned=True)
+        )
+
+        if workspace_ids is not None:
+            conditions &= Q(workspaces__in=workspace_ids)
+
+        post_vos = self.post_model.objects.filter(conditions).order_by("-created_at")
+        post_data_list = [dump_post(post_vo) for post_vo in post_vos]
+
+        cache.set(
+            cache_key,
+            post_data_list,
+            expire=config.get_global("NOTICE_FEED_CACHE_EXPIRE", 300),
+        )
+
+        return post_data_list
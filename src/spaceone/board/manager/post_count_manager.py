@@ -0,0 +1,265 @@
+import logging
+import threading
+from datetime import datetime
+from typing import Union
+
+from pymongo import UpdateOne
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.board.lib.post_query import get_filter_conditions
+from spaceone.board.model.post_count_model import PostCount, PostCountState
+from spaceone.board.model.post_model import Post
+
+_LOGGER = logging.getLogger(__name__)
+
+_POST_COUNT_KEYS = ["domain_id", "board_type", "category"]
+
+_POST_COUNT_STATE_NAME = "post_count"
+_POST_COUNT_READY_STATE = None
+_POST_COUNT_LOCK = threading.Lock()
+
+
+class PostCountManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.post_model: Post = self.locator.get_model(Post)
+        self.post_count_model: PostCount = self.locator.get_model(PostCount)
+        self.post_count_state_model: PostCountState = self.locator.get_model(
+            PostCountState
+        )
+
+    def stat_post_counts(self, query: dict) -> Union[dict, None]:
+        """Answer count-by-board_type/category queries from the materialized counts
+
+        Only a single group stage with one count field, grouped by and
+        filtered on domain_id, board_type and category, is served here.
+        Returns None for any other query.
+        """
+
+        if set(query) - {"aggregate", "filter"}:
+            return None
+
+        aggregate = query.get("aggregate", [])
+        if len(aggregate) != 1 or list(aggregate[0]) != ["group"]:
+            return None
+
+        group = aggregate[0]["group"]
+        keys = group.get("keys", [])
+        fields = group.get("fields", [])
+
+        if set(group) - {"keys", "fields"} or not keys or len(fields) != 1:
+            return None
+
+        if set(fields[0]) - {"name", "operator"}:
+            return None
+
+        if fields[0].get("operator") != "count":
+            return None
+
+        for key in keys:
+            if set(key) - {"key", "name"} or key.get("key") not in _POST_COUNT_KEYS:
+                return None
+
+        conditions = get_filter_conditions(
+            query.get("filter", []),
+            _POST_COUNT_KEYS,
+            self.post_model._meta.get("change_query_keys", {}),
+        )
+        if conditions is None or "domain_id" not in conditions:
+            return None
+
+        if not self._build_post_counts_once():
+            return None
+
+        counts = {}
+        post_count_vos = self.post_count_model.objects.filter(
+            **{f"{key}__in": values for key, values in conditions.items()}
+        )
+        for post_count_vo in post_count_vos:
+            group_values = tuple(getattr(post_count_vo, key["key"]) for key in keys)
+            counts[group_values] = (
+                counts.get(group_values, 0)
+                + (post_count_vo.base_count or 0)
+                + (post_count_vo.count or 0)
+            )
+
+        results = []
+        for group_values, count in counts.items():
+            if count <= 0:
+                continue
+
+            result = {
+                key.get("name", key["key"]): value
+                for key, value in zip(keys, group_values)
+            }
+            result[fields[0]["name"]] = count
+            results.append(result)
+
+        return {"results": results}
+
+    def increase_post_count(self, post_vo: Post, category: str, count: int) -> None:
+        # Before the first build there is nothing to keep up to date; the
+        # build counts every post. During the build, posts older than its
+        # start are left to the build.
+        if (state := self._get_post_count_state()) is None:
+            return
+
+        if state["state"] != "READY" and (
+            _truncate_to_milliseconds(post_vo.created_at) < state["started_at"]
+        ):
+            return
+
+        self.post_count_model._get_collection().update_one(
+            {
+                "domain_id": post_vo.domain_id,
+                "board_type": post_vo.board_type,
+                "category": category,
+            },
+            {"$inc": {"count": count}},
+            upsert=True,
+        )
+
+    def move_post_count(
+        self, post_vo: Post, from_category: str, to_category: str
+    ) -> None:
+        if from_category == to_category:
+            return
+
+        self.increase_post_count(post_vo, from_category, -1)
+        self.increase_post_count(post_vo, to_category, 1)
+
+    def rebuild_post_counts(self) -> None:
+        """Recount posts per (domain_id, board_type, category) from Post
+
+        Counting restarts from now, so this repairs counts that drifted.
+        Posts written while it runs may be counted wrong by one.
+        """
+
+        global _POST_COUNT_READY_STATE
+
+        state_collection = self.post_count_state_model._get_collection()
+        state_collection.update_one(
+            {"name": _POST_COUNT_STATE_NAME},
+            {
+                "$set": {
+                    "state": "BUILDING",
+                    "started_at": datetime.utcnow(),
+                    "finished_at": None,
+                }
+            },
+            upsert=True,
+        )
+
+        with _POST_COUNT_LOCK:
+            _POST_COUNT_READY_STATE = None
+
+        self.post_count_model._get_collection().update_many({}, {"$set": {"count": 0}})
+        self._build_post_counts(
+            state_collection.find_one({"name": _POST_COUNT_STATE_NAME})
+        )
+
+    def _build_post_counts_once(self) -> bool:
+        """Build the post counts on first use and return True once they are ready
+
+        The first process to get here records when the build started. Posts
+        created from then on are counted by increase_post_count; older posts
+        are counted by the build into base_count. Until the build is
+        finished, stats are served from Post.
+        """
+
+        if self._get_post_count_state(ready_only=True):
+            return True
+
+        state_collection = self.post_count_state_model._get_collection()
+        result = state_collection.update_one(
+            {"name": _POST_COUNT_STATE_NAME},
+            {"$setOnInsert": {"state": "BUILDING", "started_at": datetime.utcnow()}},
+            upsert=True,
+        )
+        state = state_collection.find_one({"name": _POST_COUNT_STATE_NAME})
+
+        if state["state"] == "READY":
+            return True
+
+        # A build left behind by a stopped process is taken over. Builds of
+        # the same started_at give the same counts, so running twice is safe.
+        build_timeout = config.get_global("POST_COUNT_BUILD_TIMEOUT", 600)
+        if result.upserted_id is None and (
+            (datetime.utcnow() - state["started_at"]).total_seconds() < build_timeout
+        ):
+            return False
+
+        _LOGGER.info("[_build_post_counts_once] build post counts")
+        self._build_post_counts(state)
+        return True
+
+    def _build_post_counts(self, state: dict) -> None:
+        global _POST_COUNT_READY_STATE
+
+        pipeline = [
+            {"$match": {"created_at": {"$lt": state["started_at"]}}},
+            {
+                "$group": {
+                    "_id": {key: f"${key}" for key in _POST_COUNT_KEYS},
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+
+        base_counts = {
+            tuple(row["_id"].get(key) for key in _POST_COUNT_KEYS): row["count"]
+            for row in self.post_model._get_collection().aggregate(pipeline)
+        }
+
+        post_count_collection = self.post_count_model._get_collection()
+        for row in post_count_collection.find(
+            {}, {key: 1 for key in _POST_COUNT_KEYS}
+        ):
+            base_counts.setdefault(tuple(row.get(key) for key in _POST_COUNT_KEYS), 0)
+
+        # Only base_count is written, so changes counted since started_at
+        # are kept.
+        if base_counts:
+            post_count_collection.bulk_write(
+                [
+                    UpdateOne(
+                        dict(zip(_POST_COUNT_KEYS, keys)),
+                        {"$set": {"base_count": base_count}},
+                        upsert=True,
+                    )
+                    for keys, base_count in base_counts.items()
+                ],
+                ordered=False,
+            )
+
+        self.post_count_state_model._get_collection().update_one(
+            {"name": _POST_COUNT_STATE_NAME, "started_at": state["started_at"]},
+            {"$set": {"state": "READY", "finished_at": datetime.utcnow()}},
+        )
+
+        with _POST_COUNT_LOCK:
+            _POST_COUNT_READY_STATE = None
+
+    def _get_post_count_state(self, ready_only: bool = False) -> Union[dict, None]:
+        global _POST_COUNT_READY_STATE
+
+        with _POST_COUNT_LOCK:
+            if _POST_COUNT_READY_STATE is not None:
+                return _POST_COUNT_READY_STATE
+
+        state = self.post_count_state_model._get_collection().find_one(
+            {"name": _POST_COUNT_STATE_NAME}
+        )
+
+        if state and state["state"] == "READY":
+            with _POST_COUNT_LOCK:
+                _POST_COUNT_READY_STATE = state
+        elif ready_only:
+            return None
+
+        return state
+
+
+def _truncate_to_milliseconds(value: datetime) -> datetime:
+    # Mongo stores datetimes in milliseconds.
+    return value.replace(microsecond=value.microsecond // 1000 * 1000)
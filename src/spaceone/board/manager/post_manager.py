@@ -1,25 +1,100 @@
+import base64
+import hashlib
+import json
 import logging
-from typing import Union
+import threading
+from datetime import datetime
+from typing import Tuple, Union
 
+from mongoengine import Q
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.board.error import *
+from spaceone.board.lib import cache
+from spaceone.board.lib.contents_renderer import render_contents
+from spaceone.board.lib.post_query import dump_post, load_post, make_scope_key
+from spaceone.board.manager.notice_feed_manager import NoticeFeedManager
+from spaceone.board.manager.post_count_manager import PostCountManager
 from spaceone.board.model.post_model import Post
 
 _LOGGER = logging.getLogger(__name__)
 
+# Filter (equality or $in) and sort fields of the queries this service issues.
+_QUERY_SHAPES = {
+    "get": {"filter": ["post_id", "domain_id", "workspaces"], "sort": []},
+    "list": {
+        "filter": ["domain_id", "workspaces", "board_type"],
+        "sort": ["created_at"],
+    },
+    "list_popup": {
+        "filter": ["domain_id", "workspaces", "board_type", "options.is_popup"],
+        "sort": ["created_at"],
+    },
+    "list_cursor": {
+        "filter": ["domain_id", "workspaces", "board_type"],
+        "sort": ["created_at", "post_id"],
+    },
+    "search": {
+        "filter": ["_fts"],  # key of the text index in index_information()
+        "sort": [],
+    },
+    "list_pinned": {
+        "filter": ["domain_id", "workspaces", "board_type", "options.is_pinned"],
+        "sort": ["created_at"],
+    },
+}
+
+# Operators of filters turned into Q by _make_filter_conditions, for queries
+# that MongoModel.query cannot express (cursor pagination and search).
+_FILTER_OPERATORS = {
+    "eq": "",
+    "not": "__ne",
+    "in": "__in",
+    "not_in": "__nin",
+    "contain": "__icontains",
+    "not_contain": "__not__icontains",
+    "contain_in": "__icontains",
+    "lt": "__lt",
+    "lte": "__lte",
+    "gt": "__gt",
+    "gte": "__gte",
+    "exists": "__exists",
+}
+
+_INDEX_COVERAGE_CHECKED = False
+_INDEX_COVERAGE_LOCK = threading.Lock()
+
 
 class PostManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.post_model: Post = self.locator.get_model(Post)
+        self.post_count_mgr: PostCountManager = self.locator.get_manager(
+            PostCountManager
+        )
+        self.notice_feed_mgr: NoticeFeedManager = self.locator.get_manager(
+            NoticeFeedManager
+        )
+
+        if config.get_global("CHECK_INDEX_COVERAGE", True):
+            self._check_index_coverage_once()
 
     def create_post(self, params: dict) -> Post:
         def _rollback(vo: Post):
             _LOGGER.info(f"[create_post._rollback] " f"Delete post : {vo.post_id}")
             vo.delete()
+            self.delete_post_cache(vo.post_id)
+            self.notice_feed_mgr.delete_notice_feed_cache_by_vo(vo)
+            self.post_count_mgr.increase_post_count(vo, vo.category, -1)
+            self.delete_stat_cache(vo.domain_id)
 
         post_vo: Post = self.post_model.create(params)
         self.transaction.add_rollback(_rollback, post_vo)
 
+        self.notice_feed_mgr.delete_notice_feed_cache_by_vo(post_vo)
+        self.post_count_mgr.increase_post_count(post_vo, post_vo.category, 1)
+        self.delete_stat_cache(post_vo.domain_id)
+
         return post_vo
 
     def update_post(self, params: dict) -> Post:
@@ -32,10 +107,27 @@ class PostManager(BaseManager):
                 f"[update_post_by_vo._rollback] Revert Data : " f'{old_data["post_id"]}'
             )
             post_vo.update(old_data)
+            self.delete_post_cache(post_vo.post_id)
+            self.notice_feed_mgr.delete_notice_feed_cache_by_vo(
+                post_vo, old_data.get("options")
+            )
+            self.post_count_mgr.move_post_count(post_vo, new_category, old_category)
+            self.delete_stat_cache(post_vo.domain_id)
+
+        old_options = post_vo.options
+        old_category = new_category = post_vo.category
 
         self.transaction.add_rollback(_rollback, post_vo.to_dict())
 
-        return post_vo.update(params)
+        post_vo = post_vo.update(params)
+        new_category = post_vo.category
+
+        self.delete_post_cache(post_vo.post_id)
+        self.notice_feed_mgr.delete_notice_feed_cache_by_vo(post_vo, old_options)
+        self.post_count_mgr.move_post_count(post_vo, old_category, new_category)
+        self.delete_stat_cache(post_vo.domain_id)
+
+        return post_vo
 
     def get_post(self, post_id: str, domain_id: str = None, workspace_id: list = None) -> Post:
         conditions = {"post_id": post_id}
@@ -46,20 +138,340 @@ class PostManager(BaseManager):
         if workspace_id:
             conditions["workspaces"] = workspace_id
 
-        return self.post_model.get(**conditions)
+        if not cache.is_set():
+            return self.post_model.get(**conditions)
+
+        # Concurrent misses of a popular post share one Mongo read.
+        post_data = cache.get_or_load(
+            self._make_post_cache_key(post_id, domain_id, workspace_id),
+            lambda: dump_post(self.post_model.get(**conditions)),
+            expire=config.get_global("POST_CACHE_EXPIRE", 60),
+        )
+
+        return load_post(self.post_model, post_data)
+
+    def render_post_contents_by_vo(self, post_vo: Post) -> Post:
+        """Backfill html_contents and excerpt of posts saved without them"""
+
+        if post_vo.html_contents is not None:
+            return post_vo
+
+        html_contents, excerpt = render_contents(
+            post_vo.contents or "",
+            post_vo.contents_type,
+            config.get_global("POST_EXCERPT_LENGTH", 200),
+        )
+
+        # Written directly so that the backfill does not touch updated_at.
+        self.post_model.objects(post_id=post_vo.post_id).update_one(
+            set__html_contents=html_contents, set__excerpt=excerpt
+        )
+        self.delete_post_cache(post_vo.post_id)
+
+        post_vo.html_contents = html_contents
+        post_vo.excerpt = excerpt
+
+        return post_vo
 
     def list_boards(self, query: Union[dict, None] = None):
         if query is None:
             query = {}
+
+        if cache.is_set():
+            result = self.notice_feed_mgr.list_posts_from_notice_feed(query)
+            if result is not None:
+                return result
+
+        if only := self._get_list_projection(query):
+            query = {**query, "only": only}
+
         return self.post_model.query(**query)
 
+    def search_boards(self, query: dict, search: str) -> Tuple[list, int]:
+        """List posts matching search on the title and contents text index
+
+        Results are ordered by relevance; title matches weigh more than
+        contents matches.
+        """
+
+        conditions = self._make_filter_conditions(
+            query.get("filter", []), query.get("filter_or", [])
+        )
+
+        post_vos = (
+            self.post_model.objects.filter(conditions)
+            .search_text(search)
+            .order_by("$text_score")
+        )
+
+        if only := self._get_list_projection(query):
+            post_vos = post_vos.only(*only)
+
+        total_count = post_vos.count()
+
+        if page := query.get("page"):
+            start = max(page.get("start", 1), 1) - 1
+            if limit := page.get("limit"):
+                post_vos = post_vos[start : start + limit]
+            else:
+                post_vos = post_vos[start:]
+
+        return list(post_vos), total_count
+
+    def list_boards_by_cursor(
+        self, query: dict, next_token: str = None
+    ) -> Tuple[list, Union[str, None]]:
+        """List posts ordered by (-created_at, -post_id) after the next_token position
+
+        No total count is computed, so every page costs the same however deep
+        the client scrolls.
+        """
+
+        page = query.get("page") or {}
+        limit = page.get("limit") or config.get_global("LIST_CURSOR_PAGE_SIZE", 100)
+
+        conditions = self._make_filter_conditions(
+            query.get("filter", []), query.get("filter_or", [])
+        )
+
+        if next_token:
+            created_at, post_id = self._decode_next_token(next_token)
+            conditions &= Q(created_at__lt=created_at) | Q(
+                created_at=created_at, post_id__lt=post_id
+            )
+
+        post_vos = self.post_model.objects.filter(conditions).order_by(
+            "-created_at", "-post_id"
+        )
+
+        if only := self._get_list_projection(query):
+            # created_at and post_id are always loaded to build the next_token
+            post_vos = post_vos.only(*set(only) | {"created_at", "post_id"})
+
+        post_vos = list(post_vos.limit(limit + 1))
+
+        if len(post_vos) > limit:
+            post_vos = post_vos[:limit]
+            return post_vos, self._encode_next_token(post_vos[-1])
+
+        return post_vos, None
+
     def stat_boards(self, query: dict) -> dict:
+        if not cache.is_set():
+            return self._stat_boards(query)
+
+        if (cache_key := self._make_stat_cache_key(query)) is None:
+            return self._stat_boards(query)
+
+        if (result := cache.get(cache_key)) is not None:
+            return result
+
+        result = self._stat_boards(query)
+
+        # The shared cache stores JSON; results grouped by dates are not cached.
+        if _is_json_serializable(result):
+            cache.set(
+                cache_key,
+                result,
+                expire=config.get_global("POST_STAT_CACHE_EXPIRE", 30),
+            )
+
+        return result
+
+    def delete_post_vo(self, post_vo: Post) -> None:
+        post_vo.delete()
+        self.delete_post_cache(post_vo.post_id)
+        self.notice_feed_mgr.delete_notice_feed_cache_by_vo(post_vo)
+        self.post_count_mgr.increase_post_count(post_vo, post_vo.category, -1)
+        self.delete_stat_cache(post_vo.domain_id)
+
+    @staticmethod
+    def delete_post_cache(post_id: str) -> None:
+        if cache.is_set():
+            cache.delete_pattern(f"board:post-info:{post_id}:*")
+
+    @staticmethod
+    def delete_stat_cache(domain_id: str) -> None:
+        # SYSTEM posts are counted in the stats of every domain.
+        if not cache.is_set():
+            return
+
+        if domain_id == "*":
+            cache.delete_pattern("board:post-stat:*")
+        else:
+            cache.delete_pattern(f"board:post-stat:*{domain_id}*")
+
+    def _stat_boards(self, query: dict) -> dict:
+        if config.get_global("POST_STAT_MATERIALIZED_COUNT", True):
+            if (result := self.post_count_mgr.stat_post_counts(query)) is not None:
+                return result
+
         return self.post_model.stat(**query)
 
     @staticmethod
-    def increase_view_count(post_vo: Post) -> None:
-        post_vo.increment("view_count")
+    def _make_stat_cache_key(query: dict) -> Union[str, None]:
+        domain_ids = None
+        for condition in query.get("filter", []):
+            if condition.get("k", condition.get("key")) == "domain_id":
+                domain_ids = condition.get("v", condition.get("value"))
+
+        # Without a domain scope the entry could not be invalidated per domain.
+        if not domain_ids:
+            return None
+
+        query_hash = hashlib.sha256(
+            json.dumps(query, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        return f"board:post-stat:{make_scope_key(domain_ids)}:{query_hash}"
+
+    def _check_index_coverage_once(self) -> None:
+        global _INDEX_COVERAGE_CHECKED
+
+        with _INDEX_COVERAGE_LOCK:
+            if _INDEX_COVERAGE_CHECKED:
+                return
+
+            _INDEX_COVERAGE_CHECKED = True
+
+        try:
+            for name, coverage in self.check_index_coverage().items():
+                if coverage == "FULL":
+                    _LOGGER.info(f"[check_index_coverage] {name}: {coverage}")
+                else:
+                    _LOGGER.warning(f"[check_index_coverage] {name}: {coverage}")
+        except Exception as e:
+            _LOGGER.warning(f"[check_index_coverage] failed to check index: {e}")
+
+    def check_index_coverage(self) -> dict:
+        """Report how the post indexes serve each query shape
+
+        Returns:
+            coverage (dict): {
+                'query shape name': 'FULL' | 'PARTIAL' | 'NONE'
+            }
+        """
+
+        indexes = self.post_model._get_collection().index_information()
+
+        coverage = {}
+        for name, query_shape in _QUERY_SHAPES.items():
+            coverage[name] = "NONE"
+
+            for index_info in indexes.values():
+                index_coverage = self._get_index_coverage(
+                    [key for key, _ in index_info["key"]],
+                    index_info.get("unique", False),
+                    query_shape,
+                )
+
+                if index_coverage == "FULL":
+                    coverage[name] = index_coverage
+                    break
+                elif index_coverage == "PARTIAL":
+                    coverage[name] = index_coverage
+
+        return coverage
 
     @staticmethod
-    def delete_post_vo(post_vo: Post) -> None:
-        post_vo.delete()
+    def _get_index_coverage(index_keys: list, unique: bool, query_shape: dict) -> str:
+        filter_keys = set(query_shape["filter"])
+        sort_keys = query_shape["sort"]
+
+        # Equality on a unique key finds at most one document.
+        if unique and len(index_keys) == 1 and index_keys[0] in filter_keys:
+            return "FULL"
+
+        prefix_keys = index_keys[: len(filter_keys)]
+        if set(prefix_keys) == filter_keys:
+            next_keys = index_keys[len(filter_keys) : len(filter_keys) + len(sort_keys)]
+            if next_keys == sort_keys:
+                return "FULL"
+
+            return "PARTIAL"
+
+        if index_keys[0] in filter_keys:
+            return "PARTIAL"
+
+        return "NONE"
+
+    def _get_list_projection(self, query: dict) -> list:
+        # Minimal responses never read contents, so keep it off the wire.
+        if only := query.get("only"):
+            return only
+
+        if query.get("minimal"):
+            return self.post_model._meta["minimal_fields"]
+
+        return []
+
+    def _make_filter_conditions(self, filters: list, filters_or: list) -> Q:
+        conditions = Q()
+        for condition in filters:
+            conditions &= self._make_filter_condition(condition)
+
+        if filters_or:
+            conditions_or = Q()
+            for condition in filters_or:
+                conditions_or |= self._make_filter_condition(condition)
+
+            conditions &= conditions_or
+
+        return conditions
+
+    def _make_filter_condition(self, condition: dict) -> Q:
+        key = condition.get("k", condition.get("key"))
+        value = condition.get("v", condition.get("value"))
+        operator = condition.get("o", condition.get("operator", "eq"))
+
+        if operator not in _FILTER_OPERATORS:
+            raise ERROR_NOT_SUPPORTED_FILTER(key=key, operator=operator)
+
+        change_query_keys = self.post_model._meta.get("change_query_keys", {})
+        key = change_query_keys.get(key, key).replace(".", "__")
+
+        if operator == "contain_in":
+            conditions = Q()
+            for item in value:
+                conditions |= Q(**{f"{key}__icontains": item})
+            return conditions
+
+        return Q(**{f"{key}{_FILTER_OPERATORS[operator]}": value})
+
+    @staticmethod
+    def _encode_next_token(post_vo: Post) -> str:
+        token_data = {
+            "created_at": post_vo.created_at.isoformat(),
+            "post_id": post_vo.post_id,
+        }
+        return base64.urlsafe_b64encode(json.dumps(token_data).encode()).decode()
+
+    @staticmethod
+    def _decode_next_token(next_token: str) -> Tuple[datetime, str]:
+        try:
+            token_data = json.loads(base64.urlsafe_b64decode(next_token.encode()))
+            return (
+                datetime.fromisoformat(token_data["created_at"]),
+                token_data["post_id"],
+            )
+        except Exception:
+            raise ERROR_INVALID_NEXT_TOKEN()
+
+    @staticmethod
+    def _make_post_cache_key(
+        post_id: str,
+        domain_id: Union[str, list, None],
+        workspace_id: Union[str, list, None],
+    ) -> str:
+        return (
+            f"board:post-info:{post_id}:"
+            f"{make_scope_key(domain_id)}:{make_scope_key(workspace_id)}"
+        )
+
+def _is_json_serializable(value) -> bool:
+    try:
+        json.dumps(value)
+    except (TypeError, ValueError):
+        return False
+
+    return True
@@ -0,0 +1,118 @@
+import logging
+from datetime import datetime
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_NOT_FOUND
+from spaceone.core.manager import BaseManager
+from spaceone.board.model.post_send_job_model import PostSendJob
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PostSendJobManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.post_send_job_model: PostSendJob = self.locator.get_model(PostSendJob)
+
+    def create_post_send_job(self, params: dict) -> PostSendJob:
+        def _rollback(vo: PostSendJob):
+            _LOGGER.info(
+                f"[create_post_send_job._rollback] " f"Delete post send job : {vo.job_id}"
+            )
+            vo.delete()
+
+        post_send_job_vo: PostSendJob = self.post_send_job_model.create(params)
+        self.transaction.add_rollback(_rollback, post_send_job_vo)
+
+        return post_send_job_vo
+
+    @staticmethod
+    def update_post_send_job_by_vo(
+        params: dict, post_send_job_vo: PostSendJob
+    ) -> PostSendJob:
+        return post_send_job_vo.update(params)
+
+    def get_post_send_job(self, job_id: str, domain_id: str = None) -> PostSendJob:
+        conditions = {"job_id": job_id}
+
+        if domain_id:
+            conditions["domain_id"] = domain_id
+
+        return self.post_send_job_model.get(**conditions)
+
+    def get_latest_post_send_job(
+        self, post_id: str, domain_id: str = None
+    ) -> PostSendJob:
+        conditions = {"post_id": post_id}
+
+        if domain_id:
+            conditions["domain_id"] = domain_id
+
+        post_send_job_vos = self.post_send_job_model.filter(**conditions).order_by(
+            "-created_at"
+        )
+
+        if post_send_job_vos.count() == 0:
+            raise ERROR_NOT_FOUND(key="post_id", value=post_id)
+
+        return post_send_job_vos[0]
+
+    def filter_post_send_jobs(self, **conditions):
+        return self.post_send_job_model.filter(**conditions)
+
+    @staticmethod
+    def increase_total_count(post_send_job_vo: PostSendJob, total_count: int) -> None:
+        # updated_at is the heartbeat that tells a running job from a stopped one.
+        post_send_job_vo.modify(
+            inc__total_count=total_count, set__updated_at=datetime.utcnow()
+        )
+
+    @staticmethod
+    def increase_sent_count(
+        post_send_job_vo: PostSendJob, sent_count: int, failed_count: int
+    ) -> None:
+        post_send_job_vo.modify(
+            inc__sent_count=sent_count,
+            inc__failed_count=failed_count,
+            set__updated_at=datetime.utcnow(),
+        )
+
+    @staticmethod
+    def is_stale_post_send_job(post_send_job_vo: PostSendJob) -> bool:
+        """Return True if a PENDING or IN_PROGRESS job has stopped making progress"""
+
+        stale_timeout = config.get_global("POST_SEND_JOB_STALE_TIMEOUT", 1800)
+        updated_at = post_send_job_vo.updated_at or post_send_job_vo.created_at
+
+        return (datetime.utcnow() - updated_at).total_seconds() > stale_timeout
+
+    def change_in_progress_state(self, post_send_job_vo: PostSendJob) -> PostSendJob:
+        post_send_job_vo = self.update_post_send_job_by_vo(
+            {"state": "IN_PROGRESS"}, post_send_job_vo
+        )
+        post_send_job_vo.modify(set__updated_at=datetime.utcnow())
+        return post_send_job_vo
+
+    def change_success_state(
+        self, post_send_job_vo: PostSendJob, error_message: str = None
+    ) -> PostSendJob:
+        return self.update_post_send_job_by_vo(
+            {
+                "state": "SUCCESS",
+                "error_message": error_message,
+                "finished_at": datetime.utcnow(),
+            },
+            post_send_job_vo,
+        )
+
+    def change_failure_state(
+        self, post_send_job_vo: PostSendJob, error_message: str
+    ) -> PostSendJob:
+        return self.update_post_send_job_by_vo(
+            {
+                "state": "FAILURE",
+                "error_message": error_message,
+                "finished_at": datetime.utcnow(),
+            },
+            post_send_job_vo,
+        )
@@ -0,0 +1,102 @@
+import atexit
+import logging
+import threading
+import time
+
+from pymongo import UpdateOne
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.board.model.post_model import Post
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ViewCountManager(BaseManager):
+    @staticmethod
+    def increase_view_count(post_vo: Post) -> None:
+        if config.get_global("VIEW_COUNT_MODE", "BUFFERED") == "SYNC":
+            post_vo.increment("view_count")
+        else:
+            _VIEW_COUNT_BUFFER.increase(post_vo.post_id)
+
+
+class _ViewCountBuffer(object):
+    """Accumulates view counts in memory and flushes them with bulk $inc writes
+
+    Counts are flushed every VIEW_COUNT_FLUSH_INTERVAL seconds, as soon as
+    VIEW_COUNT_FLUSH_THRESHOLD views are pending and at process exit, so at
+    most that many views can be lost on a crash.
+    """
+
+    def __init__(self):
+        self._counts = {}
+        self._pending_count = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._flusher = None
+
+    def increase(self, post_id: str) -> None:
+        with self._lock:
+            self._counts[post_id] = self._counts.get(post_id, 0) + 1
+            self._pending_count += 1
+            pending_count = self._pending_count
+
+            if self._flusher is None:
+                self._start_flusher()
+
+        if pending_count >= config.get_global("VIEW_COUNT_FLUSH_THRESHOLD", 1000):
+            self.flush()
+
+    def flush(self) -> None:
+        with self._flush_lock:
+            with self._lock:
+                counts = self._counts
+                self._counts = {}
+                self._pending_count = 0
+
+            if not counts:
+                return
+
+            try:
+                Post._get_collection().bulk_write(
+                    [
+                        UpdateOne({"post_id": post_id}, {"$inc": {"view_count": count}})
+                        for post_id, count in counts.items()
+                    ],
+                    ordered=False,
+                )
+            except Exception as e:
+                _LOGGER.error(
+                    f"[_ViewCountBuffer.flush] failed to flush view counts: {e}",
+                    exc_info=True,
+                )
+                self._restore(counts)
+
+    def _restore(self, counts: dict) -> None:
+        max_pending_count = config.get_global("VIEW_COUNT_FLUSH_THRESHOLD", 1000) * 10
+
+        with self._lock:
+            if self._pending_count >= max_pending_count:
+                _LOGGER.error(
+                    f"[_ViewCountBuffer._restore] drop view counts: {sum(counts.values())}"
+                )
+                return
+
+            for post_id, count in counts.items():
+                self._counts[post_id] = self._counts.get(post_id, 0) + count
+                self._pending_count += count
+
+    def _start_flusher(self) -> None:
+        self._flusher = threading.Thread(
+            target=self._run_flusher, name="view-count-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def _run_flusher(self) -> None:
+        while True:
+            time.sleep(config.get_global("VIEW_COUNT_FLUSH_INTERVAL", 10))
+            self.flush()
+
+
+_VIEW_COUNT_BUFFER = _ViewCountBuffer()
+atexit.register(_VIEW_COUNT_BUFFER.flush)
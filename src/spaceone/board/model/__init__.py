@@ -1 +1,3 @@
 from spaceone.board.model.post_model import Post
+from spaceone.board.model.post_send_job_model import PostSendJob
+from spaceone.board.model.post_count_model import PostCount, PostCountState
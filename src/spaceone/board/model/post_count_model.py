@@ -0,0 +1,33 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class PostCount(MongoModel):
+    domain_id = StringField(max_length=40)
+    board_type = StringField(max_length=40)
+    category = StringField(null=True, default=None)
+    base_count = IntField(default=0)  # posts created before the build started
+    count = IntField(default=0)  # changes counted since the build started
+
+    meta = {
+        "updatable_fields": [],
+        "indexes": [
+            {
+                "fields": ["domain_id", "board_type", "category"],
+                "name": "COMPOUND_INDEX_FOR_POST_COUNT",
+                "unique": True,
+            },
+        ],
+    }
+
+
+class PostCountState(MongoModel):
+    name = StringField(max_length=40, unique=True)
+    state = StringField(max_length=20, choices=("BUILDING", "READY"))
+    started_at = DateTimeField()
+    finished_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [],
+    }
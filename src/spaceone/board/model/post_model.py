@@ -11,6 +11,8 @@ class Post(MongoModel):
     title = StringField(max_length=255)
     contents = StringField()
     contents_type = StringField(max_length=40, default="markdown")
+    html_contents = StringField(default=None, null=True)
+    excerpt = StringField(default=None, null=True)
     options = DictField(default={})
     view_count = IntField(default=0)
     writer = StringField()
@@ -28,6 +30,8 @@ class Post(MongoModel):
             "title",
             "contents",
             "contents_type",
+            "html_contents",
+            "excerpt",
             "options",
             "writer",
             "files",
@@ -41,6 +45,7 @@ class Post(MongoModel):
             "resource_group",
             "domain_id",
             "workspaces",
+            "contents_type",
         ],
         "ordering": ["-created_at"],
         "change_query_keys": {
@@ -49,11 +54,46 @@ class Post(MongoModel):
             "workspace_id": "workspaces",
         },
         "indexes": [
+            {
+                "fields": [
+                    "domain_id",
+                    "workspaces",
+                    "board_type",
+                    "-created_at",
+                    "-post_id",
+                ],
+                "name": "COMPOUND_INDEX_FOR_LIST",
+            },
+            {
+                "fields": [
+                    "domain_id",
+                    "workspaces",
+                    "board_type",
+                    "options.is_popup",
+                    "-created_at",
+                ],
+                "name": "COMPOUND_INDEX_FOR_LIST_POPUP",
+            },
+            {
+                "fields": [
+                    "domain_id",
+                    "workspaces",
+                    "board_type",
+                    "options.is_pinned",
+                    "-created_at",
+                ],
+                "name": "COMPOUND_INDEX_FOR_LIST_PINNED",
+            },
+            {
+                "fields": ["$title", "$contents"],
+                "name": "TEXT_INDEX_FOR_SEARCH",
+                "default_language": "none",
+                "weights": {"title": 10, "contents": 1},
+            },
             "board_type",
             "category",
             "writer",
             "resource_group",
-            "domain_id",
             "workspaces",
             "user_id",
         ],
@@ -0,0 +1,45 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class PostSendJob(MongoModel):
+    job_id = StringField(max_length=40, generate_id="post-send-job", unique=True)
+    post_id = StringField(max_length=40)
+    state = StringField(
+        max_length=20,
+        default="PENDING",
+        choices=("PENDING", "IN_PROGRESS", "SUCCESS", "FAILURE"),
+    )
+    total_count = IntField(default=0)
+    sent_count = IntField(default=0)
+    failed_count = IntField(default=0)
+    error_message = StringField(default=None, null=True)
+    resource_group = StringField(max_length=40, choices=("SYSTEM", "DOMAIN", "WORKSPACE"))
+    domain_id = StringField(max_length=40)
+    user_id = StringField(max_length=40)
+    created_at = DateTimeField(auto_now_add=True)
+    updated_at = DateTimeField(auto_now=True)
+    finished_at = DateTimeField(default=None, null=True)
+
+    meta = {
+        "updatable_fields": [
+            "state",
+            "error_message",
+            "finished_at",
+        ],
+        "minimal_fields": [
+            "job_id",
+            "post_id",
+            "state",
+            "total_count",
+            "sent_count",
+            "failed_count",
+        ],
+        "ordering": ["-created_at"],
+        "indexes": [
+            "post_id",
+            "state",
+            "domain_id",
+        ],
+    }
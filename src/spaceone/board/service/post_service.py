@@ -1,19 +1,28 @@
 import copy
 import html
 import logging
-import re
-from typing import Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Queue, Empty, Full
+from typing import Callable, Iterator, Tuple, Union
 
-from spaceone.core import config, cache
+from spaceone.core import config, queue, utils
 from spaceone.core.service import *
 
 from spaceone.board.error import *
+from spaceone.board.lib import cache
+from spaceone.board.lib.contents_renderer import render_contents
+from spaceone.board.lib.xss_scanner import has_xss_pattern
 from spaceone.board.manager.config_manager import ConfigManager
 from spaceone.board.manager.email_manager import EmailManager
 from spaceone.board.manager.file_manager import FileManager
 from spaceone.board.manager.identity_manager import IdentityManager
 from spaceone.board.manager.post_manager import PostManager
+from spaceone.board.manager.post_send_job_manager import PostSendJobManager
+from spaceone.board.manager.view_count_manager import ViewCountManager
 from spaceone.board.model.post_model import Post
+from spaceone.board.model.post_send_job_model import PostSendJob
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -94,6 +103,10 @@ class PostService(BaseService):
             if contents_type not in ["html", "markdown", "plaintext"]:
                 raise ERROR_INVALID_CONTENTS_TYPE(contents_type=contents_type)
 
+        params["html_contents"], params["excerpt"] = self._render_contents(
+            params["contents"], params["contents_type"]
+        )
+
         file_ids = params.get("files", [])
         post_vo = self.post_mgr.create_post(params)
 
@@ -152,6 +165,12 @@ class PostService(BaseService):
             if contents_type not in ["html", "markdown", "plaintext"]:
                 raise ERROR_INVALID_CONTENTS_TYPE(contents_type=contents_type)
 
+        if "contents" in params or "contents_type" in params:
+            params["html_contents"], params["excerpt"] = self._render_contents(
+                params.get("contents", post_vo.contents),
+                params.get("contents_type", post_vo.contents_type),
+            )
+
         if "files" in params:
             self.file_mgr: FileManager = self.locator.get_manager(FileManager)
 
@@ -166,8 +185,7 @@ class PostService(BaseService):
                     self._update_file_reference(post_vo.post_id, file_ids_to_be_created)
 
                 if len(file_ids_to_be_deleted) > 0:
-                    for file_id in file_ids_to_be_deleted:
-                        self.file_mgr.delete_file(file_id)
+                    self.file_mgr.delete_files(file_ids_to_be_deleted)
 
         return self.post_mgr.update_post_by_vo(params, post_vo)
 
@@ -176,8 +194,8 @@ class PostService(BaseService):
         role_types=["SYSTEM_ADMIN", "DOMAIN_ADMIN"],
     )
     @check_required(["post_id"])
-    def send(self, params: dict) -> None:
-        """Delete post
+    def send(self, params: dict) -> PostSendJob:
+        """Send notice email of post
 
         Args:
             params (dict): {
@@ -186,80 +204,114 @@ class PostService(BaseService):
             }
 
         Returns:
-            None
+            post_send_job_vo (object)
         """
         post_id = params["post_id"]
         domain_id = params.get("domain_id")
 
         post_vo = self.post_mgr.get_post(post_id, domain_id)
 
-        self._check_send_notice_email(post_id, domain_id)
+        self.post_send_job_mgr: PostSendJobManager = self.locator.get_manager(
+            PostSendJobManager
+        )
 
-        self.identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
-        self.config_mgr: ConfigManager = self.locator.get_manager(ConfigManager)
+        if post_send_job_vo := self._get_running_post_send_job(post_vo, domain_id):
+            return post_send_job_vo
 
-        verified_user_emails_info = {}
+        post_send_job_vo = self.post_send_job_mgr.create_post_send_job(
+            {
+                "post_id": post_id,
+                "resource_group": post_vo.resource_group,
+                "domain_id": post_vo.domain_id,
+                "user_id": self.transaction.get_meta("authorization.user_id"),
+            }
+        )
 
-        if post_vo.resource_group == "SYSTEM":
-            domain_ids = self._get_enabled_state_domain_ids()
+        self._lock_send_notice_email(post_id, domain_id, post_send_job_vo.job_id)
 
-            for domain_id in domain_ids:
-                language = self._get_language_from_domain_config(domain_id)
-                if language not in verified_user_emails_info:
-                    verified_user_emails_info[language] = []
+        if queue_name := self._get_send_job_queue():
+            self._push_send_job_task(queue_name, post_send_job_vo)
+        else:
+            self._send_notice_email(post_send_job_vo, post_vo)
 
-                users_emails = self._get_verified_user_emails_from_domain(domain_id)
-                verified_user_emails_info[language].extend(users_emails)
-            for language, verified_user_emails in verified_user_emails_info.items():
-                verified_user_emails_info[language] = list(set(verified_user_emails))
+        return post_send_job_vo
 
-        elif post_vo.resource_group == "DOMAIN":
-            language = self._get_language_from_domain_config(domain_id)
-            if language not in verified_user_emails_info:
-                verified_user_emails_info[language] = []
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    @check_required(["job_id"])
+    def dispatch_send_job(self, params: dict) -> None:
+        """Dispatch queued notice email send job (worker)
 
-            users_emails = self._get_verified_user_emails_from_domain(domain_id)
-            verified_user_emails_info[language].extend(users_emails)
-        else:
-            if post_vo.workspaces:
-                verified_user_emails = []
-                language = self._get_language_from_domain_config(domain_id)
-                verified_user_emails_info[language] = []
+        Args:
+            params (dict): {
+                'job_id': 'str',      # required
+            }
 
-                enabled_workspaces = (
-                    self._get_enabled_state_workspace_ids_from_post_vo_workspaces(
-                        domain_id, post_vo.workspaces
-                    )
-                )
-                for workspace_id in enabled_workspaces:
-                    users_emails = self._get_verified_user_emails_from_workspace(
-                        workspace_id, domain_id
-                    )
-                    verified_user_emails.extend(users_emails)
+        Returns:
+            None
+        """
 
-                verified_user_emails_info[language].extend(
-                    list(set(verified_user_emails))
+        self.post_send_job_mgr: PostSendJobManager = self.locator.get_manager(
+            PostSendJobManager
+        )
+        post_send_job_vo = self.post_send_job_mgr.get_post_send_job(params["job_id"])
+
+        if post_send_job_vo.state == "IN_PROGRESS":
+            # A redelivered job of a worker that stopped is run again, so
+            # recipients it already reached may get the email twice.
+            if not self.post_send_job_mgr.is_stale_post_send_job(post_send_job_vo):
+                _LOGGER.debug(
+                    f"[dispatch_send_job] skip running job: {post_send_job_vo.job_id}"
                 )
+                return None
 
-        total_count = sum(
-            [len(emails) for emails in verified_user_emails_info.values()]
-        )
+            _LOGGER.warning(
+                f"[dispatch_send_job] retry stopped job: {post_send_job_vo.job_id}"
+            )
+        elif post_send_job_vo.state != "PENDING":
+            _LOGGER.debug(
+                f"[dispatch_send_job] skip job: {post_send_job_vo.job_id} ({post_send_job_vo.state})"
+            )
+            return None
 
-        if verified_user_emails_info:
-            print("verified_user_emails_info: ", verified_user_emails_info)
-            email_manager = EmailManager()
+        post_vo = self.post_mgr.get_post(post_send_job_vo.post_id)
+        self._send_notice_email(post_send_job_vo, post_vo)
 
-            _LOGGER.debug(
-                f"[send] start to send email to verified user emails (total count = {total_count}"
+    @transaction(
+        permission="board:Post.write",
+        role_types=["SYSTEM_ADMIN", "DOMAIN_ADMIN"],
+    )
+    @check_required(["post_id"])
+    def get_send_status(self, params: dict) -> PostSendJob:
+        """Get notice email send status of post
+
+        Args:
+            params (dict): {
+                'post_id': 'str',     # required
+                'job_id': 'str',      # latest job of post if not specified
+                'domain_id': 'str'    # injected from auth
+            }
+
+        Returns:
+            post_send_job_vo (object)
+        """
+
+        post_id = params["post_id"]
+        domain_id = params.get("domain_id")
+
+        self.post_send_job_mgr: PostSendJobManager = self.locator.get_manager(
+            PostSendJobManager
+        )
+
+        if job_id := params.get("job_id"):
+            post_send_job_vo = self.post_send_job_mgr.get_post_send_job(
+                job_id, domain_id
             )
+            if post_send_job_vo.post_id != post_id:
+                raise ERROR_NOT_FOUND(key="job_id", value=job_id)
 
-            for language, verified_user_emails in verified_user_emails_info.items():
-                for email in verified_user_emails:
-                    email_manager.send_notification_email(
-                        email, language, post_vo.contents, post_vo.title
-                    )
+            return post_send_job_vo
 
-        _LOGGER.debug(f"[send] verified user email count: {total_count}")
+        return self.post_send_job_mgr.get_latest_post_send_job(post_id, domain_id)
 
     @transaction(
         permission="board:Post.write",
@@ -286,9 +338,7 @@ class PostService(BaseService):
 
         if len(post_vo.files) > 0:
             self.file_mgr: FileManager = self.locator.get_manager(FileManager)
-
-            for file_id in post_vo.files:
-                self.file_mgr.delete_file(file_id)
+            self.file_mgr.delete_files(post_vo.files)
 
         self.post_mgr.delete_post_vo(post_vo)
 
@@ -324,7 +374,11 @@ class PostService(BaseService):
         resource_group = params.get("resource_group")
 
         post_vo = self.post_mgr.get_post(post_id, domain_id, workspace_id)
-        self.post_mgr.increase_view_count(post_vo)
+        post_vo = self.post_mgr.render_post_contents_by_vo(post_vo)
+        self.view_count_mgr: ViewCountManager = self.locator.get_manager(
+            ViewCountManager
+        )
+        self.view_count_mgr.increase_view_count(post_vo)
 
         self.file_mgr: FileManager = self.locator.get_manager(FileManager)
 
@@ -358,7 +412,7 @@ class PostService(BaseService):
             "workspace_id",
         ]
     )
-    def list(self, params: dict) -> dict:
+    def list(self, params: dict) -> Tuple[list, int, Union[str, None]]:
         """List posts
 
         Args:
@@ -370,6 +424,9 @@ class PostService(BaseService):
                 'writer': 'str',
                 'is_pinned': 'bool',
                 'is_popup': 'bool',
+                'search': 'str',           # full-text search ranked by relevance
+                'cursor': 'bool',          # keyset pagination without total_count
+                'next_token': 'str',       # implies cursor
                 'domain_id': 'str',        # injected from auth
                 'workspace_id': 'str',     # injected from auth
             }
@@ -377,10 +434,23 @@ class PostService(BaseService):
         Returns:
             posts_vo (object)
             total_count
+            next_token
         """
 
         query = params.get("query", {})
-        return self.post_mgr.list_boards(query)
+
+        if search := params.get("search"):
+            post_vos, total_count = self.post_mgr.search_boards(query, search)
+            return post_vos, total_count, None
+
+        if params.get("cursor") or params.get("next_token"):
+            post_vos, next_token = self.post_mgr.list_boards_by_cursor(
+                query, params.get("next_token")
+            )
+            return post_vos, 0, next_token
+
+        post_vos, total_count = self.post_mgr.list_boards(query)
+        return post_vos, total_count, None
 
     @transaction(
         permission="board:Post.read",
@@ -415,15 +485,184 @@ class PostService(BaseService):
         query = params.get("query", {})
         return self.post_mgr.stat_boards(query)
 
+    def _send_notice_email(self, post_send_job_vo: PostSendJob, post_vo: Post) -> None:
+        self.post_send_job_mgr.change_in_progress_state(post_send_job_vo)
+
+        try:
+            post_vo = self.post_mgr.render_post_contents_by_vo(post_vo)
+            error_message = self._send_notice_email_to_verified_users(
+                post_send_job_vo, post_vo
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_send_notice_email] failed to send notice email (job_id = {post_send_job_vo.job_id}): {e}",
+                exc_info=True,
+            )
+            self.post_send_job_mgr.change_failure_state(post_send_job_vo, str(e))
+            raise e
+        else:
+            self.post_send_job_mgr.change_success_state(
+                post_send_job_vo, error_message
+            )
+
+    def _send_notice_email_to_verified_users(
+        self, post_send_job_vo: PostSendJob, post_vo: Post
+    ) -> Union[str, None]:
+        """Send the notice email to verified users of the post
+
+        Returns:
+            error_message (str): set if recipients of some domains were skipped
+        """
+
+        self.identity_mgr: IdentityManager = self.locator.get_manager(IdentityManager)
+        self.config_mgr: ConfigManager = self.locator.get_manager(ConfigManager)
+
+        email_manager = None
+        total_count = 0
+        refused_count = 0
+
+        # Only hashes of sent emails are kept and their number is bounded, so
+        # memory stays flat however many recipients the post has.
+        sent_email_hashes = set()
+        dedup_max_size = config.get_global("RECIPIENT_DEDUP_MAX_SIZE", 1000000)
+        failed_domain_ids = set()
+
+        for language, users_emails in self._iter_verified_user_emails(
+            post_vo, failed_domain_ids
+        ):
+            verified_user_emails = []
+            for email in users_emails:
+                email_hash = hash(email)
+                if email_hash in sent_email_hashes:
+                    continue
+
+                if len(sent_email_hashes) < dedup_max_size:
+                    sent_email_hashes.add(email_hash)
+
+                verified_user_emails.append(email)
+
+            if not verified_user_emails:
+                continue
+
+            if email_manager is None:
+                email_manager = EmailManager()
+
+            total_count += len(verified_user_emails)
+            self.post_send_job_mgr.increase_total_count(
+                post_send_job_vo, len(verified_user_emails)
+            )
+
+            refused_emails = email_manager.send_notification_emails(
+                verified_user_emails, language, post_vo.html_contents, post_vo.title
+            )
+            refused_count += len(refused_emails)
+
+            self.post_send_job_mgr.increase_sent_count(
+                post_send_job_vo,
+                len(verified_user_emails) - len(refused_emails),
+                len(refused_emails),
+            )
+
+        _LOGGER.debug(
+            f"[_send_notice_email_to_verified_users] refused email count: {refused_count}"
+        )
+        _LOGGER.debug(
+            f"[_send_notice_email_to_verified_users] verified user email count: {total_count}"
+        )
+
+        if failed_domain_ids:
+            if total_count == 0:
+                raise ERROR_RECIPIENTS_NOT_RESOLVED(
+                    failed_domain_count=len(failed_domain_ids)
+                )
+
+            return (
+                f"Recipients of {len(failed_domain_ids)} domains could not be "
+                f"resolved and were skipped."
+            )
+
+        return None
+
+    def _iter_verified_user_emails(
+        self, post_vo: Post, failed_domain_ids: set = None
+    ) -> Iterator[tuple]:
+        domain_id = post_vo.domain_id
+
+        if post_vo.resource_group == "SYSTEM":
+            domain_ids = self._get_enabled_state_domain_ids()
+            languages = self._get_languages_from_domain_configs(domain_ids)
+
+            # Domains of the same language are resolved together, so their
+            # batches share one rendered email.
+            domain_ids.sort(key=lambda _domain_id: languages.get(_domain_id, "en"))
+
+            yield from self._iter_verified_user_emails_from_domains(
+                domain_ids, languages, failed_domain_ids
+            )
+
+        elif post_vo.resource_group == "DOMAIN":
+            language = self._get_language_from_domain_config(domain_id)
+
+            for users_emails in self._iter_verified_user_emails_from_domain(
+                domain_id
+            ):
+                yield language, users_emails
+        else:
+            if post_vo.workspaces:
+                language = self._get_language_from_domain_config(domain_id)
+
+                enabled_workspaces = (
+                    self._get_enabled_state_workspace_ids_from_post_vo_workspaces(
+                        domain_id, post_vo.workspaces
+                    )
+                )
+                for workspace_id in enabled_workspaces:
+                    for users_emails in self._iter_verified_user_emails_from_workspace(
+                        workspace_id, domain_id
+                    ):
+                        yield language, users_emails
+
+    def _push_send_job_task(
+        self, queue_name: str, post_send_job_vo: PostSendJob
+    ) -> None:
+        token = config.get_global("TOKEN") or self.transaction.get_meta("token")
+
+        task = {
+            "name": "dispatch_send_job",
+            "version": "v1",
+            "executionEngine": "BaseWorker",
+            "stages": [
+                {
+                    "locator": "SERVICE",
+                    "name": "PostService",
+                    "metadata": {"token": token},
+                    "method": "dispatch_send_job",
+                    "params": {"params": {"job_id": post_send_job_vo.job_id}},
+                }
+            ],
+        }
+
+        _LOGGER.debug(
+            f"[_push_send_job_task] push send job task: {post_send_job_vo.job_id}"
+        )
+        queue.put(queue_name, utils.dump_json(task))
+
+    @staticmethod
+    def _get_send_job_queue() -> Union[str, None]:
+        queue_name = config.get_global("EMAIL_SEND_QUEUE")
+        if queue_name and queue_name in config.get_global("QUEUES", {}):
+            return queue_name
+
+        return None
+
     def _update_file_reference(self, post_id: str, files: list) -> None:
-        for file in files:
+        if files:
             reference = {"resource_id": post_id, "resource_type": "board.Post"}
-            self.file_mgr.update_file_reference(file, reference)
+            self.file_mgr.update_file_references(files, reference)
 
     def _get_files_info_from_file_manager(self, file_ids: list):
         files_info = []
-        for file_id in file_ids:
-            file_info = self.file_mgr.get_file(file_id)
+        for file_info in self.file_mgr.list_files(file_ids):
             files_info.append(file_info["file_id"])
         return files_info
 
@@ -435,8 +674,124 @@ class PostService(BaseService):
 
         return domain_ids
 
-    def _get_verified_user_emails_from_domain(self, domain_id: str) -> list:
-        user_emails = []
+    def _iter_verified_user_emails_from_domains(
+        self, domain_ids: list, languages: dict = None, failed_domain_ids: set = None
+    ) -> Iterator[tuple]:
+        """Yield (language, verified user emails) pages of domains as they arrive
+
+        Domains are resolved concurrently by RECIPIENT_RESOLVE_CONCURRENCY
+        threads. A domain whose identity lookup fails or does not answer within
+        RECIPIENT_RESOLVE_TIMEOUT seconds is skipped and added to
+        failed_domain_ids. All remaining domains, started or not, are skipped
+        when no domain answers for RECIPIENT_RESOLVE_TIMEOUT seconds or the
+        lookups were waited on for RECIPIENT_RESOLVE_TOTAL_TIMEOUT seconds.
+        """
+
+        concurrency = config.get_global("RECIPIENT_RESOLVE_CONCURRENCY", 10)
+        timeout = config.get_global("RECIPIENT_RESOLVE_TIMEOUT", 60)
+        total_timeout = config.get_global("RECIPIENT_RESOLVE_TOTAL_TIMEOUT", 3600)
+        languages = languages or {}
+
+        if failed_domain_ids is None:
+            failed_domain_ids = set()
+
+        pages = Queue(maxsize=concurrency * 2)
+        stop_event = threading.Event()
+        lookup_started_at = {}
+
+        def _put_page(page: tuple) -> None:
+            while not stop_event.is_set():
+                try:
+                    pages.put(page, timeout=1)
+                    return
+                except Full:
+                    continue
+
+        def _resolve_domain(domain_id: str) -> None:
+            if stop_event.is_set():
+                return
+
+            try:
+                lookup_started_at[domain_id] = time.monotonic()
+                language = languages.get(domain_id)
+                if language is None:
+                    language = self._get_language_from_domain_config(domain_id)
+
+                for users_emails in self._iter_verified_user_emails_from_domain(
+                    domain_id
+                ):
+                    # Waiting for the email stage does not count as lookup time.
+                    lookup_started_at.pop(domain_id, None)
+                    _put_page((domain_id, language, users_emails))
+
+                    if stop_event.is_set():
+                        return
+
+                    lookup_started_at[domain_id] = time.monotonic()
+            except Exception as e:
+                failed_domain_ids.add(domain_id)
+                _LOGGER.error(
+                    f"[_iter_verified_user_emails_from_domains] failed to resolve recipients in domain_id: {domain_id} {e}"
+                )
+            finally:
+                lookup_started_at.pop(domain_id, None)
+                _put_page((domain_id, None, None))
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        remaining_domain_ids = set(domain_ids)
+
+        # Only time spent waiting here counts, not time in the email stage.
+        waited_seconds = 0
+        idle_seconds = 0
+
+        try:
+            for domain_id in domain_ids:
+                executor.submit(_resolve_domain, domain_id)
+
+            while remaining_domain_ids:
+                wait_started_at = time.monotonic()
+                try:
+                    domain_id, language, users_emails = pages.get(timeout=1)
+                except Empty:
+                    domain_id, language, users_emails = None, None, None
+
+                waited = time.monotonic() - wait_started_at
+                waited_seconds += waited
+
+                if domain_id in remaining_domain_ids:
+                    idle_seconds = 0
+
+                    if users_emails is None:
+                        remaining_domain_ids.discard(domain_id)
+                    else:
+                        yield language, users_emails
+                else:
+                    idle_seconds += waited
+
+                now = time.monotonic()
+                for domain_id, started_at in list(lookup_started_at.items()):
+                    if domain_id in remaining_domain_ids and now - started_at > timeout:
+                        remaining_domain_ids.discard(domain_id)
+                        failed_domain_ids.add(domain_id)
+                        _LOGGER.error(
+                            f"[_iter_verified_user_emails_from_domains] timed out to resolve recipients in domain_id: {domain_id}"
+                        )
+
+                # Hung lookups keep their threads, so queued domains may never
+                # start; they are given up on with the lookups in progress.
+                if remaining_domain_ids and (
+                    idle_seconds > timeout or waited_seconds > total_timeout
+                ):
+                    failed_domain_ids.update(remaining_domain_ids)
+                    _LOGGER.error(
+                        f"[_iter_verified_user_emails_from_domains] gave up resolving recipients in {len(remaining_domain_ids)} domains: {sorted(remaining_domain_ids)}"
+                    )
+                    remaining_domain_ids.clear()
+        finally:
+            stop_event.set()
+            executor.shutdown(wait=False)
+
+    def _iter_verified_user_emails_from_domain(self, domain_id: str) -> Iterator[list]:
         query_filter = {
             "only": [
                 "user_id",
@@ -451,19 +806,20 @@ class PostService(BaseService):
                 {"k": "email_verified", "v": True, "o": "eq"},
             ],
         }
-        response = self.identity_mgr.list_users(domain_id, {"query": query_filter})
-        users_info = response.get("results", [])
-        user_emails.extend([user["email"] for user in users_info])
 
-        verified_user_emails = list(set(user_emails))
-        total_count = len(verified_user_emails)
+        total_count = 0
+        for users_info in self._iter_pages(
+            lambda query: self.identity_mgr.list_users(domain_id, {"query": query}),
+            query_filter,
+        ):
+            users_emails = [user["email"] for user in users_info if user.get("email")]
+            total_count += len(users_emails)
+            yield users_emails
 
         _LOGGER.debug(
-            f"[_get_verified_user_emails_from_domain] user email count: {total_count} in domain_id: {domain_id}"
+            f"[_iter_verified_user_emails_from_domain] user email count: {total_count} in domain_id: {domain_id}"
         )
 
-        return verified_user_emails
-
     def _get_enabled_state_workspace_ids_from_post_vo_workspaces(
         self, domain_id: str, workspace_ids: list
     ) -> list:
@@ -495,10 +851,9 @@ class PostService(BaseService):
 
         return workspace_ids
 
-    def _get_verified_user_emails_from_workspace(
+    def _iter_verified_user_emails_from_workspace(
         self, workspace_id: str, domain_id: str
-    ) -> list:
-        workspace_user_emails = []
+    ) -> Iterator[list]:
         query_filter = {
             "filter": [
                 {"k": "state", "v": "ENABLED", "o": "eq"},
@@ -506,20 +861,84 @@ class PostService(BaseService):
                 {"k": "email_verified", "v": True, "o": "eq"},
             ],
         }
-        response = self.identity_mgr.list_workspace_users(
-            {"query": query_filter, "workspace_id": workspace_id},
-            domain_id,
-            workspace_id,
-        )
-        users_info = response.get("results", [])
-        total_count = response.get("total_count", 0)
-        workspace_user_emails.extend([user["email"] for user in users_info])
+
+        total_count = 0
+        for users_info in self._iter_pages(
+            lambda query: self.identity_mgr.list_workspace_users(
+                {"query": query, "workspace_id": workspace_id},
+                domain_id,
+                workspace_id,
+            ),
+            query_filter,
+        ):
+            users_emails = [user["email"] for user in users_info if user.get("email")]
+            total_count += len(users_emails)
+            yield users_emails
 
         _LOGGER.debug(
-            f"[_get_verified_user_emails_from_workspace] user email count: {total_count} in workspace_id: {workspace_id}"
+            f"[_iter_verified_user_emails_from_workspace] user email count: {total_count} in workspace_id: {workspace_id}"
         )
 
-        return workspace_user_emails
+    @staticmethod
+    def _iter_pages(list_func: Callable[[dict], dict], query: dict) -> Iterator[list]:
+        page_size = config.get_global("RECIPIENT_PAGE_SIZE", 1000)
+        start = 1
+
+        while True:
+            query["page"] = {"start": start, "limit": page_size}
+            response = list_func(query)
+            results = response.get("results", [])
+
+            if results:
+                yield results
+
+            if len(results) < page_size:
+                break
+
+            start += page_size
+
+    def _get_languages_from_domain_configs(self, domain_ids: list) -> dict:
+        """Resolve the languages of many domains with paged DomainConfig.list calls
+
+        The per-domain config cache is filled with the returned configs.
+        Domains missing from the response are left out, so their language is
+        looked up per domain; if listing fails, an empty dict is returned.
+
+        Returns:
+            languages (dict): {domain_id: language}
+        """
+
+        page_size = config.get_global("DOMAIN_CONFIG_PREFETCH_PAGE_SIZE", 500)
+        languages = {}
+
+        try:
+            for idx in range(0, len(domain_ids), page_size):
+                page_domain_ids = domain_ids[idx : idx + page_size]
+                query = {
+                    "filter": [
+                        {"k": "name", "v": "settings", "o": "eq"},
+                        {"k": "domain_id", "v": page_domain_ids, "o": "in"},
+                    ],
+                    "page": {"start": 1, "limit": len(page_domain_ids)},
+                }
+
+                response = self.config_mgr.list_domain_configs({"query": query})
+
+                for domain_config_info in response.get("results", []):
+                    domain_id = domain_config_info.get("domain_id")
+                    domain_config_data = domain_config_info.get("data") or {}
+
+                    languages[domain_id] = domain_config_data.get("language", "en")
+                    self.config_mgr.set_domain_config_cache(
+                        domain_id, domain_config_info
+                    )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_get_languages_from_domain_configs] failed to list domain configs: {e}"
+            )
+            return {}
+
+        return languages
 
     def _get_language_from_domain_config(self, domain_id: str) -> str:
         language = "en"
@@ -534,23 +953,50 @@ class PostService(BaseService):
 
         return language
 
+    def _get_running_post_send_job(
+        self, post_vo: Post, domain_id: str
+    ) -> Union[PostSendJob, None]:
+        """Return the PENDING or IN_PROGRESS send job of the post, if any
+
+        Jobs are looked up in Mongo, so a broadcast that outlives the
+        EMAIL_SEND_RETRY_INTERVAL lock is still not started twice. A job that
+        stopped making progress is marked as FAILURE and a new one may start.
+        """
+
+        post_send_job_vos = self.post_send_job_mgr.filter_post_send_jobs(
+            post_id=post_vo.post_id,
+            domain_id=post_vo.domain_id,
+            state=["PENDING", "IN_PROGRESS"],
+        )
+
+        for post_send_job_vo in post_send_job_vos:
+            if not self.post_send_job_mgr.is_stale_post_send_job(post_send_job_vo):
+                return post_send_job_vo
+
+            _LOGGER.warning(
+                f"[_get_running_post_send_job] stopped job: {post_send_job_vo.job_id}"
+            )
+            self.post_send_job_mgr.change_failure_state(
+                post_send_job_vo, "The send job stopped without finishing."
+            )
+
+        if cache.is_set():
+            if cache.get(f"board:post:send:{post_vo.post_id}:{domain_id}"):
+                raise ERROR_NOTICE_EMAIL_ALREADY_SENT(post_id=post_vo.post_id)
+
+        return None
+
     @staticmethod
-    def _check_send_notice_email(post_id: str, domain_id: str) -> None:
+    def _lock_send_notice_email(post_id: str, domain_id: str, job_id: str) -> None:
         if cache.is_set():
-            cached_send_notice_email_info = cache.get(
-                f"board:post:send:{post_id}:{domain_id}"
+            email_send_retry_interval = config.get_global(
+                "EMAIL_SEND_RETRY_INTERVAL", 180
+            )
+            cache.set(
+                f"board:post:send:{post_id}:{domain_id}",
+                job_id,
+                expire=email_send_retry_interval,
             )
-            if cached_send_notice_email_info:
-                raise ERROR_NOTICE_EMAIL_ALREADY_SENT(post_id=post_id)
-            else:
-                email_send_retry_interval = config.get_global(
-                    "EMAIL_SEND_RETRY_INTERVAL", 180
-                )
-                cache.set(
-                    f"board:post:send:{post_id}:{domain_id}",
-                    True,
-                    expire=email_send_retry_interval,
-                )
 
     @staticmethod
     def _valid_options(options: dict) -> None:
@@ -561,41 +1007,16 @@ class PostService(BaseService):
                 raise ERROR_INVALID_KEY_IN_OPTIONS(key=key)
 
     @staticmethod
-    def _check_contents(contents: str) -> str:
-        js_patterns = [
-            r"<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>",  # <script> tags
-            r"javascript:",  # javascript: URLs
-            r'on\w+="[^"]*"',  # Inline event handlers like onclick, onload, etc.
-            r"on\w+=\'[^\']*\'",  # Inline event handlers with single quotes
-            r"on\w+=\w+\([^)]*\)",  # Inline event handlers with function calls
-            r"data:",  # data: URLs
-            r"vbscript:",  # vbscript: URLs
-            r"&{.*}",  # CSS expression attacks
-            r"expression\s*\(",  # CSS expression attacks
-            r"url\s*\(",  # CSS url attacks
-            r"@import",  # CSS import attacks
-            r"<[^>]*\b(?:onerror|onload|onmouseover|onclick|onmouseout|onkeypress|onkeydown|onkeyup|onsubmit|onfocus|onblur|onchange|onreset|onselect|onabort|ondblclick|onunload|onbeforeunload)\b[^>]*>",
-            # all kinds of event handlers
-            r"src[\r\n]*=[\r\n]*['\"]?(.*?)['\"]?.*\b(?:onerror|onload)\b",  # src event handler
-            r"document\.(?:location|cookie|write)",  # unsafe document modifications
-            r"(?:\\x[0-9a-fA-F]{2}|\\u[0-9a-fA-F]{4})",  # Unicode escape sequences
-            r"<!--[^>]*-->",  # code inside HTML comments
-        ]
+    def _render_contents(contents: str, contents_type: str) -> Tuple[str, str]:
+        return render_contents(
+            contents, contents_type, config.get_global("POST_EXCERPT_LENGTH", 200)
+        )
 
+    @staticmethod
+    def _check_contents(contents: str) -> str:
         # XSS patterns check before saving
-        for pattern in js_patterns:
-            if re.search(pattern, contents, re.IGNORECASE | re.MULTILINE | re.DOTALL):
-                raise ERROR_INVALID_CONTENTS()
-
-        if any(
-            x in contents.lower()
-            for x in ["<img", "<iframe", "<embed", "<object", "<link", "<meta", "<base"]
-        ):
-            if any(
-                y in contents.lower()
-                for y in ["onerror", "onload", "src=", "data:", "href=", "content="]
-            ):
-                raise ERROR_INVALID_CONTENTS()
+        if has_xss_pattern(contents):
+            raise ERROR_INVALID_CONTENTS()
 
         contents = html.escape(contents, quote=True)
         return contents
@@ -0,0 +1,137 @@
+"""Measure PostsInfo serialization throughput for large list responses
+
+Usage:
+    python -m test.benchmark.benchmark_post_info [--rows 10000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import time
+
+from spaceone.api.board.v1 import post_pb2
+from spaceone.core import utils
+from spaceone.core.pygrpc.message_type import change_struct_type, change_list_value_type
+
+from spaceone.board.info.post_info import PostsInfo
+from spaceone.board.model.post_model import Post
+
+
+def legacy_post_info(post_vo, minimal=False, files_info=None):
+    # PostInfo before the serializer used precomputed field accessors.
+    info = {
+        "board_type": post_vo.board_type,
+        "post_id": post_vo.post_id,
+        "category": post_vo.category,
+        "title": post_vo.title,
+        "resource_group": post_vo.resource_group,
+        "domain_id": post_vo.domain_id,
+        "workspaces": post_vo.workspaces,
+        "contents_type": post_vo.contents_type,
+    }
+
+    if not minimal:
+        info.update(
+            {
+                "contents": post_vo.contents,
+                "view_count": post_vo.view_count,
+                "writer": post_vo.writer,
+                "options": change_struct_type(post_vo.options),
+                "user_id": post_vo.user_id,
+                "created_at": utils.datetime_to_iso8601(post_vo.created_at),
+                "updated_at": utils.datetime_to_iso8601(post_vo.updated_at),
+            }
+        )
+
+        if files_info:
+            info["files"] = change_list_value_type(files_info)
+        else:
+            info["files"] = change_list_value_type(post_vo.files)
+
+    return post_pb2.PostInfo(**info)
+
+
+def legacy_posts_info(post_vos, total_count, **kwargs):
+    return post_pb2.PostsInfo(
+        results=list(map(functools.partial(legacy_post_info, **kwargs), post_vos)),
+        total_count=total_count,
+    )
+
+
+def make_post_data(rows: int) -> list:
+    created_at = datetime.datetime(2024, 1, 1)
+
+    return [
+        {
+            "board_type": "NOTICE",
+            "post_id": f"post-{idx:012x}",
+            "category": "maintenance",
+            "title": f"Scheduled maintenance {idx}",
+            "contents": "Maintenance window.\n" * 20,
+            "html_contents": "<p>Maintenance window.</p>" * 20,
+            "excerpt": "Maintenance window.",
+            "contents_type": "markdown",
+            "options": {"is_pinned": idx % 10 == 0, "is_popup": False},
+            "view_count": idx,
+            "writer": "admin",
+            "files": [],
+            "resource_group": "DOMAIN",
+            "domain_id": "domain-123456789012",
+            "workspaces": ["*"],
+            "user_id": "admin@example.com",
+            "created_at": created_at + datetime.timedelta(minutes=idx),
+            "updated_at": created_at + datetime.timedelta(minutes=idx),
+        }
+        for idx in range(rows)
+    ]
+
+
+def _measure(func, post_vos: list, repeat: int, **kwargs) -> float:
+    elapsed = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(post_vos, len(post_vos), **kwargs)
+        elapsed.append(time.perf_counter() - start)
+
+    return min(elapsed)
+
+
+def run(rows: int, repeat: int) -> list:
+    post_data = make_post_data(rows)
+    post_vos = [Post(**data) for data in post_data]
+
+    cases = [
+        ("legacy", legacy_posts_info, post_vos),
+        ("post_vo", PostsInfo, post_vos),
+        ("raw_document", PostsInfo, post_data),
+    ]
+
+    results = []
+    for minimal in [False, True]:
+        for name, func, posts in cases:
+            seconds = _measure(func, posts, repeat, minimal=minimal)
+            results.append(
+                {
+                    "serializer": name,
+                    "minimal": minimal,
+                    "rows": rows,
+                    "seconds": round(seconds, 6),
+                    "rows_per_second": round(rows / seconds),
+                }
+            )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.rows, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main()
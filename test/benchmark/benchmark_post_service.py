@@ -0,0 +1,217 @@
+"""Measure latency and throughput of the PostService hot paths
+
+Posts are seeded into mongomock through PostFactory. Identity, config,
+file and SMTP calls are answered by local fakes, so the numbers cover the
+board service itself: create, get, list, stat and send.
+
+Usage:
+    python -m test.benchmark.benchmark_post_service [--scales 100 1000 10000]
+        [--iterations 100] [--recipients 1000] [--mongo mongomock://localhost]
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+from contextlib import ExitStack
+from unittest.mock import patch
+
+import factory
+from mongoengine import connect, disconnect
+from spaceone.core import config
+from spaceone.core.transaction import Transaction
+
+from spaceone.board.connector.smtp_connector import SMTPConnector
+from spaceone.board.manager.config_manager import ConfigManager
+from spaceone.board.manager.file_manager import FileManager
+from spaceone.board.manager.identity_manager import IdentityManager
+from spaceone.board.model import Post, PostCount, PostSendJob
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+
+DOMAIN_ID = "domain-benchmark"
+
+STAT_QUERY = {
+    "aggregate": [
+        {
+            "group": {
+                "keys": [{"key": "board_type", "name": "board_type"}],
+                "fields": [{"operator": "count", "name": "count"}],
+            }
+        }
+    ]
+}
+
+
+class FakeIdentity(object):
+    def __init__(self, recipients: int):
+        self.users = [
+            {"user_id": f"user-{idx}", "email": f"user-{idx}@example.com"}
+            for idx in range(recipients)
+        ]
+
+    def list_users(self, domain_id: str, params: dict) -> dict:
+        page = params["query"].get("page", {})
+        start = page.get("start", 1) - 1
+        limit = page.get("limit", len(self.users))
+        return {"results": self.users[start : start + limit]}
+
+
+def _fake_patches(recipients: int) -> list:
+    identity = FakeIdentity(recipients)
+
+    return [
+        patch.object(IdentityManager, "__init__", return_value=None),
+        patch.object(IdentityManager, "list_users", side_effect=identity.list_users),
+        patch.object(ConfigManager, "__init__", return_value=None),
+        patch.object(
+            ConfigManager,
+            "get_domain_config",
+            return_value={"data": {"language": "en"}},
+        ),
+        patch.object(FileManager, "list_files", return_value=[]),
+        patch.object(FileManager, "update_file_references", return_value=None),
+        patch.object(FileManager, "delete_files", return_value=None),
+        patch.object(SMTPConnector, "__init__", return_value=None),
+        patch.object(SMTPConnector, "send_email", return_value={}),
+    ]
+
+
+def _make_service(method: str) -> PostService:
+    transaction = Transaction(
+        {"service": "board", "api_class": "Post", "user_id": "admin@example.com"}
+    )
+    transaction.method = method
+    return PostService(transaction=transaction)
+
+
+def _seed(scale: int) -> list:
+    Post.objects.delete()
+    PostCount.objects.delete()
+    PostSendJob.objects.delete()
+
+    post_vos = PostFactory.create_batch(
+        scale,
+        domain_id=DOMAIN_ID,
+        board_type=factory.Iterator(["NOTICE", "FAQ"]),
+        category=factory.Iterator(["maintenance", "release", "event"]),
+    )
+
+    _make_service("stat").post_mgr.post_count_mgr.rebuild_post_counts()
+
+    return [post_vo.post_id for post_vo in post_vos]
+
+
+def _measure(operation: str, scale: int, iterations: int, func) -> dict:
+    elapsed = []
+    failed = 0
+
+    for idx in range(iterations):
+        start = time.perf_counter()
+        try:
+            func(idx)
+        except Exception:
+            failed += 1
+        elapsed.append(time.perf_counter() - start)
+
+    elapsed.sort()
+    total_seconds = sum(elapsed)
+    p95_index = min(int(len(elapsed) * 0.95), len(elapsed) - 1)
+
+    return {
+        "operation": operation,
+        "scale": scale,
+        "iterations": iterations,
+        "failed": failed,
+        "total_seconds": round(total_seconds, 6),
+        "mean_ms": round(statistics.mean(elapsed) * 1000, 3),
+        "p50_ms": round(elapsed[len(elapsed) // 2] * 1000, 3),
+        "p95_ms": round(elapsed[p95_index] * 1000, 3),
+        "ops_per_second": round(iterations / total_seconds, 2),
+    }
+
+
+def run_scale(scale: int, iterations: int, send_iterations: int) -> list:
+    post_ids = _seed(scale)
+    results = []
+
+    def _create(idx):
+        _make_service("create").create(
+            {
+                "board_type": "NOTICE",
+                "title": f"benchmark {idx}",
+                "contents": "# Maintenance\n\nThe service will be unavailable.",
+                "resource_group": "DOMAIN",
+                "domain_id": DOMAIN_ID,
+                "user_id": "admin@example.com",
+            }
+        )
+
+    def _get(idx):
+        _make_service("get").get(
+            {"post_id": random.choice(post_ids), "domain_id": DOMAIN_ID}
+        )
+
+    def _list(minimal: bool):
+        def _run(idx):
+            _make_service("list").list(
+                {
+                    "query": {"page": {"start": 1, "limit": 100}, "minimal": minimal},
+                    "domain_id": DOMAIN_ID,
+                }
+            )
+
+        return _run
+
+    def _stat(idx):
+        _make_service("stat").stat({"query": STAT_QUERY, "domain_id": DOMAIN_ID})
+
+    def _send(idx):
+        _make_service("send").send({"post_id": post_ids[idx], "domain_id": DOMAIN_ID})
+
+    results.append(_measure("get", scale, iterations, _get))
+    results.append(_measure("list", scale, iterations, _list(False)))
+    results.append(_measure("list_minimal", scale, iterations, _list(True)))
+    results.append(_measure("stat", scale, iterations, _stat))
+    results.append(_measure("send", scale, min(send_iterations, scale), _send))
+    results.append(_measure("create", scale, iterations, _create))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--send-iterations", type=int, default=5)
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--mongo", default="mongomock://localhost")
+    args = parser.parse_args()
+
+    config.init_conf(package="spaceone.board")
+    config.set_service_config()
+    config.set_global(
+        MOCK_MODE=True, CHECK_INDEX_COVERAGE=False, VIEW_COUNT_MODE="SYNC"
+    )
+    connect("board-benchmark", host=args.mongo)
+
+    results = []
+    try:
+        with ExitStack() as stack:
+            for fake_patch in _fake_patches(args.recipients):
+                stack.enter_context(fake_patch)
+
+            for scale in args.scales:
+                results.extend(
+                    run_scale(scale, args.iterations, args.send_iterations)
+                )
+    finally:
+        disconnect()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
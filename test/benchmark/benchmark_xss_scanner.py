@@ -0,0 +1,61 @@
+"""Compare the contents XSS scanner with the previous per-pattern regex checks
+
+Usage:
+    python -m test.benchmark.benchmark_xss_scanner [--legacy-max-size 1024]
+"""
+
+import argparse
+import json
+import time
+
+from spaceone.board.lib.xss_scanner import has_xss_pattern
+
+from test.lib.test_xss_scanner import PATHOLOGICAL_CONTENTS, legacy_has_xss_pattern
+
+SIZES = [1024, 16 * 1024, 128 * 1024, 1024 * 1024]
+
+
+def _measure(func, contents: str) -> float:
+    start = time.perf_counter()
+    func(contents)
+    return time.perf_counter() - start
+
+
+def run(legacy_max_size: int) -> list:
+    results = []
+
+    for name, corpus in PATHOLOGICAL_CONTENTS.items():
+        for size in SIZES:
+            contents = corpus[:size]
+            result = {
+                "input": name,
+                "size": len(contents),
+                "scanner_seconds": round(_measure(has_xss_pattern, contents), 6),
+                "legacy_seconds": None,
+            }
+
+            if len(contents) <= legacy_max_size:
+                result["legacy_seconds"] = round(
+                    _measure(legacy_has_xss_pattern, contents), 6
+                )
+
+            results.append(result)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--legacy-max-size",
+        type=int,
+        default=1024,
+        help="largest input measured with the legacy patterns (some grow cubically)",
+    )
+    args = parser.parse_args()
+
+    print(json.dumps(run(args.legacy_max_size), indent=2))
+
+
+if __name__ == "__main__":
+    main()
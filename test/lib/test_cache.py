@@ -0,0 +1,138 @@
+import fnmatch
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+
+from spaceone.board.lib import cache
+
+
+class FakeSharedCache(object):
+    def __init__(self):
+        self.data = {}
+        self.get_count = 0
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        self.get_count += 1
+        return self.data.get(key)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def delete_pattern(self, pattern):
+        for key in fnmatch.filter(list(self.data), pattern):
+            del self.data[key]
+
+
+class TestTwoTierCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # set_global ignores keys that init_conf has not defined.
+        config.init_conf(package="spaceone.board")
+        super().setUpClass()
+
+    def setUp(self):
+        config.set_global(
+            L1_CACHE_MAX_SIZE=2,
+            L1_CACHE_POLICIES={"board:post-info:": {"expire": 60}},
+        )
+        cache.clear_local_cache()
+        self.shared_cache = FakeSharedCache()
+        self.patcher = patch.object(cache, "_shared_cache", self.shared_cache)
+        self.patcher.start()
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_get_from_local_cache(self):
+        cache.set("board:post-info:post-1:-:-", {"post_id": "post-1"}, expire=60)
+
+        self.assertEqual(cache.get("board:post-info:post-1:-:-")["post_id"], "post-1")
+        self.assertEqual(self.shared_cache.get_count, 0)
+
+    def test_key_without_policy_bypasses_local_cache(self):
+        cache.set("board:post:send:post-1:domain-1", "job-1", expire=60)
+
+        self.assertEqual(cache.get("board:post:send:post-1:domain-1"), "job-1")
+        self.assertEqual(self.shared_cache.get_count, 1)
+
+    def test_delete_pattern_clears_both_tiers(self):
+        cache.set("board:post-info:post-1:-:-", {"post_id": "post-1"}, expire=60)
+        cache.delete_pattern("board:post-info:post-1:*")
+
+        self.assertIsNone(cache.get("board:post-info:post-1:-:-"))
+
+    def test_local_cache_is_bounded(self):
+        for idx in range(3):
+            cache.set(f"board:post-info:post-{idx}:-:-", idx, expire=60)
+
+        cache.get("board:post-info:post-0:-:-")
+
+        self.assertEqual(self.shared_cache.get_count, 1)
+
+    def test_stats(self):
+        cache.set("board:post-info:post-1:-:-", 1, expire=60)
+        cache.get("board:post-info:post-1:-:-")
+        cache.get("board:post-info:post-2:-:-")
+
+        stats = cache.get_stats()["board:post-info:"]
+        self.assertGreaterEqual(stats["l1_hit"], 1)
+        self.assertGreaterEqual(stats["miss"], 1)
+
+    def test_get_or_load_coalesces_concurrent_misses(self):
+        load_count = 0
+
+        def _load():
+            nonlocal load_count
+            load_count += 1
+            time.sleep(0.1)
+            return {"post_id": "post-1"}
+
+        threads = [
+            threading.Thread(
+                target=cache.get_or_load,
+                args=("board:post-info:post-1:-:-", _load),
+                kwargs={"expire": 60},
+            )
+            for _ in range(10)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(load_count, 1)
+        self.assertEqual(cache.get("board:post-info:post-1:-:-")["post_id"], "post-1")
+
+    def test_single_flight_shares_error(self):
+        def _load():
+            time.sleep(0.1)
+            raise ValueError("failed")
+
+        errors = []
+
+        def _run():
+            try:
+                cache.single_flight("board:file-list:file-1", _load)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=_run) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
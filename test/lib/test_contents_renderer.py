@@ -0,0 +1,54 @@
+import html
+import unittest
+
+from spaceone.board.lib.contents_renderer import render_contents
+
+
+class TestContentsRenderer(unittest.TestCase):
+    def test_render_markdown_contents(self):
+        html_contents, excerpt = render_contents("# Notice\n\n**maintenance**", "markdown")
+
+        self.assertIn("<h1>Notice</h1>", html_contents)
+        self.assertIn("<strong>maintenance</strong>", html_contents)
+        self.assertEqual(excerpt, "Notice maintenance")
+
+    def test_render_escaped_markdown_contents(self):
+        html_contents, _ = render_contents("&lt;b&gt;bold&lt;/b&gt;", "markdown")
+
+        self.assertNotIn("<b>", html_contents)
+
+    def test_render_html_contents(self):
+        html_contents, excerpt = render_contents(
+            "&lt;p&gt;a &amp;amp; b&lt;/p&gt;&lt;style&gt;p {}&lt;/style&gt;", "html"
+        )
+
+        self.assertEqual(html_contents, "<p>a &amp; b</p>")
+        self.assertEqual(excerpt, "a & b")
+
+    def test_render_html_contents_with_xss(self):
+        html_contents, _ = render_contents(
+            html.escape('<a href="jav&#x61;script:alert(1)">link</a>'), "html"
+        )
+
+        self.assertEqual(html_contents, "<a>link</a>")
+
+    def test_render_markdown_link_with_xss(self):
+        html_contents, _ = render_contents("[link](javascript:alert(1))", "markdown")
+
+        self.assertNotIn("javascript", html_contents)
+
+    def test_render_plaintext_contents(self):
+        html_contents, excerpt = render_contents("line1\nline2 &lt;b&gt;", "plaintext")
+
+        self.assertEqual(html_contents, "<p>line1<br />\nline2 &lt;b&gt;</p>")
+        self.assertEqual(excerpt, "line1 line2 <b>")
+
+    def test_excerpt_length(self):
+        _, excerpt = render_contents("word " * 100, "plaintext", excerpt_length=20)
+
+        self.assertEqual(len(excerpt), 20)
+        self.assertTrue(excerpt.endswith("…"))
+
+
+if __name__ == "__main__":
+    unittest.main()
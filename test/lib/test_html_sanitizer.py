@@ -0,0 +1,65 @@
+import unittest
+
+from spaceone.board.lib.html_sanitizer import sanitize_html
+
+
+class TestHTMLSanitizer(unittest.TestCase):
+    def test_keep_allowed_markup(self):
+        html_contents = (
+            '<h1>Notice</h1><p>a &amp; <strong>b</strong><br />'
+            '<a href="https://example.com/?a=1&amp;b=2" title="t">link</a></p>'
+            '<img src="/files/image.png" alt="image" />'
+        )
+
+        self.assertEqual(sanitize_html(html_contents), html_contents)
+
+    def test_remove_encoded_javascript_urls(self):
+        self.assertEqual(
+            sanitize_html('<a href="jav&#x61;script:alert(1)">link</a>'), "<a>link</a>"
+        )
+        self.assertEqual(
+            sanitize_html('<a href=" java\tscript:alert(1)">link</a>'), "<a>link</a>"
+        )
+        self.assertEqual(
+            sanitize_html('<img src="data:image/svg+xml;base64,AAAA" />'), "<img />"
+        )
+
+    def test_remove_forms_and_event_handlers(self):
+        self.assertEqual(
+            sanitize_html(
+                '<form action="java&#x73;cript:alert(1)"><p>text</p></form>'
+            ),
+            "<p>text</p>",
+        )
+        self.assertEqual(
+            sanitize_html("<details open ontoggle=alert&#40;1&#41;>text</details>"),
+            "text",
+        )
+        self.assertEqual(
+            sanitize_html('<p onclick="alert(1)" style="color: red">text</p>'),
+            "<p>text</p>",
+        )
+
+    def test_drop_script_and_style_contents(self):
+        self.assertEqual(
+            sanitize_html(
+                "<p>a</p><style>p {}</style><script>alert(1)</script><p>b</p>"
+            ),
+            "<p>a</p><p>b</p>",
+        )
+
+    def test_escape_text_and_close_open_tags(self):
+        self.assertEqual(
+            sanitize_html("<p><b>&lt;script&gt; & </i>text"),
+            "<p><b>&lt;script&gt; &amp; text</b></p>",
+        )
+
+    def test_keep_relative_urls(self):
+        self.assertEqual(
+            sanitize_html('<a href="/posts?next=a:b#top">link</a>'),
+            '<a href="/posts?next=a:b#top">link</a>',
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import time
+import unittest
+from unittest.mock import patch
+
+from spaceone.core import config
+from spaceone.core.auth.jwt.jwt_util import JWTUtil
+
+from spaceone.board.lib import token_claims
+
+
+class TestTokenClaims(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # set_global ignores keys that init_conf has not defined.
+        config.init_conf(package="spaceone.board")
+        super().setUpClass()
+
+    def setUp(self):
+        config.set_global(TOKEN_CLAIMS_CACHE_MAX_SIZE=2, TOKEN_CLAIMS_CACHE_EXPIRE=300)
+        token_claims._TOKEN_CLAIMS.clear()
+
+    @patch.object(JWTUtil, "unverified_decode")
+    def test_decode_once(self, mock_unverified_decode):
+        mock_unverified_decode.return_value = {
+            "typ": "SYSTEM_TOKEN",
+            "exp": time.time() + 3600,
+        }
+
+        for _ in range(3):
+            self.assertEqual(
+                token_claims.get_value_from_token("token-1", "typ"), "SYSTEM_TOKEN"
+            )
+
+        self.assertEqual(mock_unverified_decode.call_count, 1)
+
+    @patch.object(JWTUtil, "unverified_decode")
+    def test_expired_token_is_not_cached(self, mock_unverified_decode):
+        mock_unverified_decode.return_value = {"typ": "ACCESS_TOKEN", "exp": 1}
+
+        token_claims.get_token_claims("token-1")
+        token_claims.get_token_claims("token-1")
+
+        self.assertEqual(mock_unverified_decode.call_count, 2)
+
+    @patch.object(JWTUtil, "unverified_decode")
+    def test_cache_is_bounded(self, mock_unverified_decode):
+        mock_unverified_decode.return_value = {"typ": "ACCESS_TOKEN"}
+
+        for idx in range(3):
+            token_claims.get_token_claims(f"token-{idx}")
+
+        self.assertEqual(len(token_claims._TOKEN_CLAIMS), 2)
+
+    @patch.object(JWTUtil, "unverified_decode")
+    def test_invalid_token_falls_back_to_default(self, mock_unverified_decode):
+        mock_unverified_decode.side_effect = ValueError("invalid token")
+
+        self.assertEqual(
+            token_claims.get_value_from_token("invalid", "typ", "USER"), "USER"
+        )
+        self.assertEqual(len(token_claims._TOKEN_CLAIMS), 0)
+
+    def test_empty_token(self):
+        self.assertEqual(token_claims.get_token_claims(None), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
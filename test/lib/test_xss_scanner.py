@@ -0,0 +1,134 @@
+import re
+import time
+import unittest
+
+from spaceone.board.lib.xss_scanner import has_xss_pattern
+
+# Patterns of the previous PostService._check_contents, kept as the reference
+# behaviour for small inputs.
+LEGACY_JS_PATTERNS = [
+    r"<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>",
+    r"javascript:",
+    r'on\w+="[^"]*"',
+    r"on\w+=\'[^\']*\'",
+    r"on\w+=\w+\([^)]*\)",
+    r"data:",
+    r"vbscript:",
+    r"&{.*}",
+    r"expression\s*\(",
+    r"url\s*\(",
+    r"@import",
+    r"<[^>]*\b(?:onerror|onload|onmouseover|onclick|onmouseout|onkeypress|onkeydown|onkeyup|onsubmit|onfocus|onblur|onchange|onreset|onselect|onabort|ondblclick|onunload|onbeforeunload)\b[^>]*>",
+    r"src[\r\n]*=[\r\n]*['\"]?(.*?)['\"]?.*\b(?:onerror|onload)\b",
+    r"document\.(?:location|cookie|write)",
+    r"(?:\\x[0-9a-fA-F]{2}|\\u[0-9a-fA-F]{4})",
+    r"<!--[^>]*-->",
+]
+
+
+def legacy_has_xss_pattern(contents: str) -> bool:
+    for pattern in LEGACY_JS_PATTERNS:
+        if re.search(pattern, contents, re.IGNORECASE | re.MULTILINE | re.DOTALL):
+            return True
+
+    if any(
+        x in contents.lower()
+        for x in ["<img", "<iframe", "<embed", "<object", "<link", "<meta", "<base"]
+    ):
+        if any(
+            y in contents.lower()
+            for y in ["onerror", "onload", "src=", "data:", "href=", "content="]
+        ):
+            return True
+
+    return False
+
+
+SAFE_CONTENTS = [
+    "This is test sample of contents.",
+    "# Notice\n\nThe service will be **unavailable** on Monday.\n\n- item one\n- item two",
+    "Contact us at support@cloudforet.com (business hours only).",
+    "Use `kubectl get pods` and check the content of the output.",
+    "Mention the onboarding guide and the button on the left.",
+    "A > B and C < D are comparisons, not tags.",
+    "<b>bold</b> and <i>italic</i> text",
+    "Price is $10 {discount applied}",
+    "<script is not closed here",
+    "<!-- unterminated comment",
+    "src is just a word, as is onload",
+    "someone said hello",
+    "the url of the page is in the docs",
+]
+
+MALICIOUS_CONTENTS = [
+    "<script>alert(1)</script>",
+    "<SCRIPT src=x></SCRIPT>",
+    "[click](javascript:alert(1))",
+    "<a href=\"vbscript:msgbox(1)\">x</a>",
+    "![x](data:image/svg+xml;base64,AAAA)",
+    '<div onclick="alert(1)">x</div>',
+    "<div onmouseover='alert(1)'>x</div>",
+    "<body onload=init()>",
+    "<div onfocus >x</div>",
+    "<img src=x onerror=alert(1)>",
+    "<img src='x'>",
+    "<iframe href=x>",
+    "<meta content=0>",
+    "<img\nsrc\n=\nx\nonload>",
+    "style=\"width: expression(alert(1))\"",
+    "background: url (x)",
+    "@import 'evil.css';",
+    "&{alert(1)};",
+    "document.cookie",
+    "Document.Write('x')",
+    "\\x3cscript\\x3e",
+    "\\u003cscript\\u003e",
+    "<!-- <img src=x> -->",
+    "<!---->",
+]
+
+PATHOLOGICAL_SIZE = 1024 * 1024
+
+PATHOLOGICAL_CONTENTS = {
+    "repeated_script_openers": "<script" * (PATHOLOGICAL_SIZE // 7),
+    "repeated_angle_brackets": "<" * PATHOLOGICAL_SIZE,
+    "unclosed_tag": "<a " + "a" * PATHOLOGICAL_SIZE,
+    "repeated_comment_openers": "<!--" * (PATHOLOGICAL_SIZE // 4),
+    "repeated_on_prefixes": "on" * (PATHOLOGICAL_SIZE // 2),
+    "on_attribute_without_quote_close": 'onx="' * (PATHOLOGICAL_SIZE // 5),
+    "src_without_handler": "src=" * (PATHOLOGICAL_SIZE // 4),
+    "long_whitespace_before_paren": "url" + " " * PATHOLOGICAL_SIZE,
+    "markdown_text": (
+        "## Maintenance notice\n\nThe content of this page is updated "
+        "on a regular basis. Please check the button on the top.\n\n"
+    )
+    * (PATHOLOGICAL_SIZE // 110),
+}
+
+
+class TestXSSScanner(unittest.TestCase):
+    def test_safe_contents(self):
+        for contents in SAFE_CONTENTS:
+            self.assertFalse(has_xss_pattern(contents), contents)
+
+    def test_malicious_contents(self):
+        for contents in MALICIOUS_CONTENTS:
+            self.assertTrue(has_xss_pattern(contents), contents)
+
+    def test_same_result_as_legacy_patterns(self):
+        for contents in SAFE_CONTENTS + MALICIOUS_CONTENTS:
+            self.assertEqual(
+                legacy_has_xss_pattern(contents), has_xss_pattern(contents), contents
+            )
+
+    def test_pathological_contents_in_linear_time(self):
+        for name, contents in PATHOLOGICAL_CONTENTS.items():
+            start = time.perf_counter()
+            has_xss_pattern(contents)
+            elapsed = time.perf_counter() - start
+
+            self.assertLess(elapsed, 5, name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import fnmatch
+import json
+
+
+class JSONSharedCache(object):
+    """Shared cache that stores values as JSON, like the Redis backend"""
+
+    def __init__(self):
+        self.data = {}
+
+    def is_set(self):
+        return True
+
+    def get(self, key):
+        if (value := self.data.get(key)) is None:
+            return None
+
+        return json.loads(value)
+
+    def set(self, key, value, expire=None):
+        self.data[key] = json.dumps(value)
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+    def delete_pattern(self, pattern):
+        for key in fnmatch.filter(list(self.data), pattern):
+            del self.data[key]
@@ -452,7 +452,7 @@ class TestPostService(unittest.TestCase):
 
         self.transaction.method = "list"
         post_vos = PostService(transaction=self.transaction)
-        post_svc_vos, total_count = post_vos.list(params)
+        post_svc_vos, total_count, next_token = post_vos.list(params)
         PostsInfo(post_svc_vos, total_count)
 
         self.assertEqual(len(post_svc_vos), 1)
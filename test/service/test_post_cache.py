@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+
+from spaceone.board.lib import cache
+from spaceone.board.model import Post
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+from test.service.fake_cache import JSONSharedCache
+
+
+class TestPostCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(
+            MOCK_MODE=True, CHECK_INDEX_COVERAGE=False, VIEW_COUNT_MODE="SYNC"
+        )
+        connect("test", host="mongomock://localhost")
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        self.shared_cache = JSONSharedCache()
+        self.patches = [
+            patch.object(cache, "_shared_cache", self.shared_cache),
+            patch.object(SpaceConnector, "__init__", return_value=None),
+            patch.object(SpaceConnector, "dispatch", return_value={"results": []}),
+        ]
+
+        for _patch in self.patches:
+            _patch.start()
+
+        cache.clear_local_cache()
+
+    def tearDown(self, *args) -> None:
+        for _patch in self.patches:
+            _patch.stop()
+
+        cache.clear_local_cache()
+        Post.objects.filter().delete()
+
+    def _get_post(self, post_id: str) -> Post:
+        post_svc = PostService(metadata=self.metadata)
+        post_vo, _ = post_svc.get({"post_id": post_id, "domain_id": self.domain_id})
+        return post_vo
+
+    def test_get_post_through_json_cache(self):
+        new_post_vo = PostFactory(
+            domain_id=self.domain_id,
+            html_contents="<p>This is test sample of contents.</p>",
+            excerpt="This is test sample of contents.",
+        )
+
+        post_vo = self._get_post(new_post_vo.post_id)
+        self.assertTrue(
+            any(key.startswith("board:post-info:") for key in self.shared_cache.data)
+        )
+
+        # Read the post back from the JSON encoded shared cache, not from L1.
+        cache.clear_local_cache()
+        with patch.object(Post, "get") as mock_get:
+            cached_post_vo = self._get_post(new_post_vo.post_id)
+            mock_get.assert_not_called()
+
+        self.assertEqual(cached_post_vo.post_id, new_post_vo.post_id)
+        self.assertEqual(cached_post_vo.id, new_post_vo.id)
+        self.assertEqual(cached_post_vo.title, post_vo.title)
+        self.assertEqual(cached_post_vo.options, new_post_vo.options)
+        self.assertEqual(
+            cached_post_vo.created_at.replace(microsecond=0),
+            new_post_vo.created_at.replace(microsecond=0),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+import threading
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+
+from spaceone.board.model import Post
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+
+TOKEN = "domain-admin-token"
+
+
+class TestPostFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True, CHECK_INDEX_COVERAGE=False)
+        connect("test", host="mongomock://localhost")
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"token": TOKEN, "user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+        self.patches = [
+            patch.object(SpaceConnector, "__init__", return_value=None),
+            patch.object(SpaceConnector, "dispatch", side_effect=self._dispatch),
+        ]
+
+        for _patch in self.patches:
+            _patch.start()
+
+    def tearDown(self, *args) -> None:
+        for _patch in self.patches:
+            _patch.stop()
+
+        Post.objects.filter().delete()
+
+    def _dispatch(self, method, params=None, token=None, **kwargs):
+        with self.lock:
+            self.calls.append((method, params, token, threading.get_ident()))
+
+        return {}
+
+    def test_create_post_with_files(self):
+        file_ids = [utils.generate_id("file") for _ in range(5)]
+
+        post_svc = PostService(metadata=self.metadata)
+        post_vo = post_svc.create(
+            {
+                "board_type": "NOTICE",
+                "title": "post with files",
+                "contents": "See the attached files.",
+                "files": file_ids,
+                "resource_group": "DOMAIN",
+                "domain_id": self.domain_id,
+                "user_id": "admin@example.com",
+            }
+        )
+
+        updates = [call for call in self.calls if call[0] == "File.update"]
+        self.assertEqual(
+            sorted(params["file_id"] for _, params, *_ in updates), sorted(file_ids)
+        )
+        self._assert_called_from_pool_threads(updates)
+
+        for _, params, token, _ in updates:
+            self.assertEqual(token, TOKEN)
+            self.assertEqual(
+                params["reference"],
+                {"resource_id": post_vo.post_id, "resource_type": "board.Post"},
+            )
+
+    def test_delete_post_with_files(self):
+        file_ids = [utils.generate_id("file") for _ in range(3)]
+        post_vo = PostFactory(domain_id=self.domain_id, files=file_ids)
+
+        post_svc = PostService(metadata=self.metadata)
+        post_svc.delete({"post_id": post_vo.post_id, "domain_id": self.domain_id})
+
+        deletes = [call for call in self.calls if call[0] == "File.delete"]
+        self.assertEqual(
+            sorted(params["file_id"] for _, params, *_ in deletes), sorted(file_ids)
+        )
+        self._assert_called_from_pool_threads(deletes)
+
+        for _, _, token, _ in deletes:
+            self.assertEqual(token, TOKEN)
+
+    def _assert_called_from_pool_threads(self, calls):
+        # The token has to reach calls made outside the request thread,
+        # where there is no transaction to read it from.
+        thread_ids = {thread_id for *_, thread_id in calls}
+        self.assertNotIn(threading.get_ident(), thread_ids)
+
+
+if __name__ == "__main__":
+    unittest.main()
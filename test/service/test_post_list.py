@@ -0,0 +1,114 @@
+import datetime
+import os
+import unittest
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+
+from spaceone.board.error import *
+from spaceone.board.model import Post
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+
+# mongomock has no $text search; set this to run the search tests on MongoDB.
+MONGO_HOST = os.environ.get("BOARD_TEST_MONGO_HOST")
+
+
+class TestPostList(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True, CHECK_INDEX_COVERAGE=False)
+        connect("test", host=MONGO_HOST or "mongomock://localhost")
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def tearDown(self, *args) -> None:
+        Post.objects.filter().delete()
+
+    def _list(self, params: dict) -> tuple:
+        post_svc = PostService(metadata=self.metadata)
+        post_vos, total_count, next_token = post_svc.list(
+            {"domain_id": self.domain_id, **params}
+        )
+        return list(post_vos), total_count, next_token
+
+    def test_list_by_cursor(self):
+        created_at = datetime.datetime(2024, 1, 1)
+
+        # Two posts share created_at, so post_id breaks the tie.
+        post_vos = [
+            PostFactory(
+                domain_id=self.domain_id,
+                created_at=created_at + datetime.timedelta(days=min(idx, 3)),
+            )
+            for idx in range(5)
+        ]
+        expected_post_ids = [
+            post_vo.post_id
+            for post_vo in sorted(
+                post_vos,
+                key=lambda post_vo: (post_vo.created_at, post_vo.post_id),
+                reverse=True,
+            )
+        ]
+
+        post_ids = []
+        next_token = None
+        for _ in range(3):
+            params = {"query": {"page": {"limit": 2}}, "cursor": True}
+            if next_token:
+                params["next_token"] = next_token
+
+            page_post_vos, total_count, next_token = self._list(params)
+
+            self.assertEqual(total_count, 0)
+            post_ids.extend(post_vo.post_id for post_vo in page_post_vos)
+
+        self.assertEqual(post_ids, expected_post_ids)
+        self.assertIsNone(next_token)
+
+    def test_list_by_cursor_with_invalid_next_token(self):
+        with self.assertRaises(ERROR_INVALID_NEXT_TOKEN):
+            self._list({"next_token": "invalid"})
+
+    def test_search_with_unsupported_filter(self):
+        query = {"filter": [{"k": "title", "v": "notice", "o": "regex"}]}
+
+        with self.assertRaises(ERROR_NOT_SUPPORTED_FILTER):
+            self._list({"query": query, "search": "maintenance"})
+
+    @unittest.skipUnless(MONGO_HOST, "full-text search needs MongoDB")
+    def test_search_ranks_title_matches_first(self):
+        PostFactory(
+            domain_id=self.domain_id,
+            title="Release notes",
+            contents="The maintenance window is on Sunday.",
+        )
+        title_post_vo = PostFactory(
+            domain_id=self.domain_id,
+            title="Maintenance notice",
+            contents="The service will be unavailable.",
+        )
+        PostFactory(domain_id=self.domain_id, title="Event", contents="Join us.")
+
+        post_vos, total_count, next_token = self._list(
+            {"query": {"page": {"start": 1, "limit": 10}}, "search": "maintenance"}
+        )
+
+        self.assertEqual(total_count, 2)
+        self.assertIsNone(next_token)
+        self.assertEqual(post_vos[0].post_id, title_post_vo.post_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
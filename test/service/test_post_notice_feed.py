@@ -0,0 +1,120 @@
+import datetime
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+
+from spaceone.board.lib import cache
+from spaceone.board.model import Post
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+from test.service.fake_cache import JSONSharedCache
+
+
+class TestPostNoticeFeed(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True, CHECK_INDEX_COVERAGE=False)
+        connect("test", host="mongomock://localhost")
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        self.shared_cache = JSONSharedCache()
+        self.patches = [
+            patch.object(cache, "_shared_cache", self.shared_cache),
+            patch.object(SpaceConnector, "__init__", return_value=None),
+            patch.object(SpaceConnector, "dispatch", return_value={"results": []}),
+        ]
+
+        for _patch in self.patches:
+            _patch.start()
+
+        cache.clear_local_cache()
+
+    def tearDown(self, *args) -> None:
+        for _patch in self.patches:
+            _patch.stop()
+
+        cache.clear_local_cache()
+        Post.objects.filter().delete()
+
+    def _list_popup_posts(self) -> tuple:
+        post_svc = PostService(metadata=self.metadata)
+        post_vos, total_count, _ = post_svc.list(
+            {
+                "query": {"filter": [{"k": "is_popup", "v": True, "o": "eq"}]},
+                "domain_id": self.domain_id,
+            }
+        )
+        return list(post_vos), total_count
+
+    def test_list_popup_posts_through_json_cache(self):
+        created_at = datetime.datetime(2024, 1, 1)
+        for idx in range(3):
+            PostFactory(
+                domain_id=self.domain_id,
+                options={"is_pinned": False, "is_popup": idx != 1},
+                created_at=created_at + datetime.timedelta(days=idx),
+            )
+
+        post_vos, total_count = self._list_popup_posts()
+        self.assertEqual(total_count, 2)
+        self.assertTrue(
+            any(
+                key.startswith("board:post-notice-feed:")
+                for key in self.shared_cache.data
+            )
+        )
+
+        # Read the feed back from the JSON encoded shared cache, not from L1.
+        cache.clear_local_cache()
+        cached_post_vos, cached_total_count = self._list_popup_posts()
+
+        self.assertEqual(cached_total_count, 2)
+        self.assertEqual(
+            [post_vo.post_id for post_vo in cached_post_vos],
+            [post_vo.post_id for post_vo in post_vos],
+        )
+        self.assertEqual(
+            [post_vo.created_at for post_vo in cached_post_vos],
+            [created_at + datetime.timedelta(days=2), created_at],
+        )
+
+    def test_create_post_invalidates_feed(self):
+        PostFactory(
+            domain_id=self.domain_id, options={"is_pinned": False, "is_popup": True}
+        )
+        self.assertEqual(self._list_popup_posts()[1], 1)
+
+        post_svc = PostService(metadata=self.metadata)
+        with patch.object(PostService, "_update_file_reference"):
+            post_svc.create(
+                {
+                    "board_type": "NOTICE",
+                    "title": "popup",
+                    "contents": "popup contents",
+                    "options": {"is_popup": True},
+                    "resource_group": "DOMAIN",
+                    "domain_id": self.domain_id,
+                    "user_id": "admin@example.com",
+                }
+            )
+
+        self.assertEqual(self._list_popup_posts()[1], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
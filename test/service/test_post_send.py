@@ -0,0 +1,287 @@
+import datetime
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+from spaceone.core.connector.space_connector import SpaceConnector
+
+from spaceone.board.manager.config_manager import ConfigManager
+from spaceone.board.manager.identity_manager import IdentityManager
+from spaceone.board.model import Post, PostSendJob
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+
+TOKEN = "system-token"
+
+
+class FakeSpaceConnector(object):
+    """Answers identity and config calls and records the token of each call"""
+
+    def __init__(self, users_per_domain: int = 3, failed_domain_ids: list = None):
+        self.users_per_domain = users_per_domain
+        self.failed_domain_ids = failed_domain_ids or []
+        self.hung_domain_ids = []
+        self.languages = {}
+        self.release_event = threading.Event()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def dispatch(self, method, params=None, token=None, x_domain_id=None, **kwargs):
+        with self.lock:
+            self.calls.append((method, token, x_domain_id, threading.get_ident()))
+
+        if x_domain_id in self.failed_domain_ids:
+            raise Exception(f"{method} failed")
+
+        if x_domain_id in self.hung_domain_ids:
+            self.release_event.wait()
+
+        if method == "User.list":
+            page = params["query"]["page"]
+            users = [
+                {"user_id": f"user-{idx}", "email": f"user-{idx}@{x_domain_id}.com"}
+                for idx in range(self.users_per_domain)
+            ]
+            start = page["start"] - 1
+            return {"results": users[start : start + page["limit"]]}
+
+        if method == "DomainConfig.get":
+            language = self.languages.get(x_domain_id, "en")
+            return {"domain_id": x_domain_id, "data": {"language": language}}
+
+        if method == "DomainConfig.list":
+            domain_ids = params["query"]["filter"][1]["v"]
+            return {
+                "results": [
+                    {"domain_id": domain_id, "data": {"language": language}}
+                    for domain_id, language in self.languages.items()
+                    if domain_id in domain_ids
+                ]
+            }
+
+        return {"results": []}
+
+
+class TestPostSend(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(MOCK_MODE=True, CHECK_INDEX_COVERAGE=False)
+        connect("test", host="mongomock://localhost")
+
+        cls.metadata = {"token": TOKEN, "user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        config.set_global(
+            RECIPIENT_RESOLVE_CONCURRENCY=4,
+            RECIPIENT_RESOLVE_TIMEOUT=5,
+            RECIPIENT_PAGE_SIZE=2,
+        )
+
+        self.connector = FakeSpaceConnector()
+        self.patches = [
+            patch(
+                "spaceone.board.manager.identity_manager.get_value_from_token",
+                return_value="SYSTEM_TOKEN",
+            ),
+            patch(
+                "spaceone.board.manager.config_manager.get_value_from_token",
+                return_value="SYSTEM_TOKEN",
+            ),
+            patch.object(SpaceConnector, "__init__", return_value=None),
+            patch.object(
+                SpaceConnector, "dispatch", side_effect=self.connector.dispatch
+            ),
+        ]
+
+        for _patch in self.patches:
+            _patch.start()
+
+    def tearDown(self, *args) -> None:
+        self.connector.release_event.set()
+
+        for _patch in self.patches:
+            _patch.stop()
+
+        Post.objects.filter().delete()
+        PostSendJob.objects.filter().delete()
+
+    def _make_service(self) -> PostService:
+        post_svc = PostService(metadata=self.metadata)
+        post_svc.identity_mgr = post_svc.locator.get_manager(IdentityManager)
+        post_svc.config_mgr = post_svc.locator.get_manager(ConfigManager)
+        return post_svc
+
+    def test_resolve_domains_with_caller_token(self):
+        domain_ids = [utils.generate_id("domain") for _ in range(6)]
+        post_svc = self._make_service()
+        failed_domain_ids = set()
+
+        pages = list(
+            post_svc._iter_verified_user_emails_from_domains(
+                domain_ids, failed_domain_ids=failed_domain_ids
+            )
+        )
+
+        # Recipients are streamed in pages of at most RECIPIENT_PAGE_SIZE.
+        self.assertTrue(all(len(users_emails) <= 2 for _, users_emails in pages))
+        self.assertEqual(
+            sorted(email for _, users_emails in pages for email in users_emails),
+            sorted(
+                f"user-{idx}@{domain_id}.com"
+                for domain_id in domain_ids
+                for idx in range(3)
+            ),
+        )
+        self.assertEqual(failed_domain_ids, set())
+
+        lookups = [call for call in self.connector.calls if call[0] == "User.list"]
+        self.assertTrue(
+            any(thread_id != threading.get_ident() for *_, thread_id in lookups)
+        )
+        self.assertEqual(
+            {domain_id for _, _, domain_id, _ in lookups}, set(domain_ids)
+        )
+
+        for method, token, domain_id, _ in self.connector.calls:
+            with self.subTest(method=method, domain_id=domain_id):
+                self.assertEqual(token, TOKEN)
+
+    def test_resolve_domains_reports_failed_domains(self):
+        domain_ids = [utils.generate_id("domain") for _ in range(3)]
+        self.connector.failed_domain_ids = domain_ids[:1]
+        post_svc = self._make_service()
+        failed_domain_ids = set()
+
+        pages = list(
+            post_svc._iter_verified_user_emails_from_domains(
+                domain_ids,
+                {domain_id: "en" for domain_id in domain_ids},
+                failed_domain_ids,
+            )
+        )
+
+        self.assertEqual(failed_domain_ids, {domain_ids[0]})
+        self.assertEqual(sum(len(users_emails) for _, users_emails in pages), 6)
+
+    def test_resolve_domains_gives_up_on_hung_lookups(self):
+        config.set_global(
+            RECIPIENT_RESOLVE_CONCURRENCY=2,
+            RECIPIENT_RESOLVE_TIMEOUT=1,
+        )
+
+        domain_ids = [utils.generate_id("domain") for _ in range(4)]
+        self.connector.hung_domain_ids = domain_ids[:2]
+        post_svc = self._make_service()
+        failed_domain_ids = set()
+
+        started_at = time.monotonic()
+        pages = list(
+            post_svc._iter_verified_user_emails_from_domains(
+                domain_ids,
+                {domain_id: "en" for domain_id in domain_ids},
+                failed_domain_ids,
+            )
+        )
+
+        # The queued domains never start while the hung lookups hold the pool.
+        self.assertLess(time.monotonic() - started_at, 10)
+        self.assertEqual(pages, [])
+        self.assertEqual(failed_domain_ids, set(domain_ids))
+
+    def test_languages_of_domains_missing_from_config_list(self):
+        domain_ids = [utils.generate_id("domain") for _ in range(3)]
+        self.connector.languages = {domain_ids[0]: "ko"}
+        post_svc = self._make_service()
+
+        languages = post_svc._get_languages_from_domain_configs(domain_ids)
+
+        # Domains missing from the list are left to DomainConfig.get.
+        self.assertEqual(languages, {domain_ids[0]: "ko"})
+
+        self.connector.languages[domain_ids[1]] = "ja"
+        self.assertEqual(
+            post_svc._get_language_from_domain_config(domain_ids[1]), "ja"
+        )
+
+    def _create_post_send_job(
+        self, post_vo: Post, state: str, idle_seconds: int = 0
+    ) -> PostSendJob:
+        post_send_job_vo = PostSendJob.create(
+            {
+                "post_id": post_vo.post_id,
+                "state": state,
+                "resource_group": post_vo.resource_group,
+                "domain_id": post_vo.domain_id,
+            }
+        )
+
+        updated_at = datetime.datetime.utcnow() - datetime.timedelta(
+            seconds=idle_seconds
+        )
+        PostSendJob.objects(job_id=post_send_job_vo.job_id).update_one(
+            set__updated_at=updated_at
+        )
+        post_send_job_vo.reload()
+
+        return post_send_job_vo
+
+    def _send(self, post_vo: Post) -> PostSendJob:
+        return self._make_service().send(
+            {"post_id": post_vo.post_id, "domain_id": post_vo.domain_id}
+        )
+
+    @patch.object(PostService, "_send_notice_email")
+    def test_send_returns_running_job(self, mock_send_notice_email):
+        config.set_global(POST_SEND_JOB_STALE_TIMEOUT=1800)
+        post_vo = PostFactory()
+
+        # The job outlived the EMAIL_SEND_RETRY_INTERVAL lock.
+        running_job_vo = self._create_post_send_job(post_vo, "IN_PROGRESS", 600)
+
+        post_send_job_vo = self._send(post_vo)
+
+        self.assertEqual(post_send_job_vo.job_id, running_job_vo.job_id)
+        self.assertEqual(PostSendJob.objects.count(), 1)
+        mock_send_notice_email.assert_not_called()
+
+    @patch.object(PostService, "_send_notice_email")
+    def test_send_replaces_stopped_job(self, mock_send_notice_email):
+        config.set_global(POST_SEND_JOB_STALE_TIMEOUT=1800)
+        post_vo = PostFactory()
+        stopped_job_vo = self._create_post_send_job(post_vo, "IN_PROGRESS", 3600)
+
+        post_send_job_vo = self._send(post_vo)
+
+        self.assertNotEqual(post_send_job_vo.job_id, stopped_job_vo.job_id)
+        self.assertEqual(stopped_job_vo.reload().state, "FAILURE")
+        mock_send_notice_email.assert_called_once()
+
+    @patch.object(PostService, "_send_notice_email")
+    def test_dispatch_send_job_retries_stopped_job(self, mock_send_notice_email):
+        config.set_global(POST_SEND_JOB_STALE_TIMEOUT=1800)
+        post_vo = PostFactory()
+        running_job_vo = self._create_post_send_job(post_vo, "IN_PROGRESS", 600)
+        stopped_job_vo = self._create_post_send_job(post_vo, "IN_PROGRESS", 3600)
+
+        post_svc = self._make_service()
+        post_svc.dispatch_send_job({"job_id": running_job_vo.job_id})
+        mock_send_notice_email.assert_not_called()
+
+        post_svc.dispatch_send_job({"job_id": stopped_job_vo.job_id})
+        mock_send_notice_email.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
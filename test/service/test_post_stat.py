@@ -0,0 +1,146 @@
+import copy
+import datetime
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+from spaceone.core import config, utils
+
+from spaceone.board.manager import post_count_manager
+from spaceone.board.model import Post, PostCount, PostCountState
+from spaceone.board.service.post_service import PostService
+
+from test.factory.post_factory import PostFactory
+
+STAT_QUERY = {
+    "aggregate": [
+        {
+            "group": {
+                "keys": [{"key": "category", "name": "category"}],
+                "fields": [{"operator": "count", "name": "count"}],
+            }
+        }
+    ]
+}
+
+
+class TestPostStat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package="spaceone.board")
+        config.set_service_config()
+        config.set_global(
+            MOCK_MODE=True,
+            CHECK_INDEX_COVERAGE=False,
+            POST_STAT_MATERIALIZED_COUNT=True,
+        )
+        connect("test", host="mongomock://localhost")
+
+        cls.domain_id = utils.generate_id("domain")
+        cls.metadata = {"user_id": utils.generate_id("user")}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        super().tearDownClass()
+        disconnect()
+
+    def setUp(self):
+        post_count_manager._POST_COUNT_READY_STATE = None
+
+    def tearDown(self, *args) -> None:
+        post_count_manager._POST_COUNT_READY_STATE = None
+        Post.objects.filter().delete()
+        PostCount.objects.filter().delete()
+        PostCountState.objects.filter().delete()
+
+    def _make_service(self) -> PostService:
+        return PostService(metadata=self.metadata)
+
+    def _create_post(self, category: str) -> Post:
+        with patch.object(PostService, "_update_file_reference"):
+            return self._make_service().create(
+                {
+                    "board_type": "NOTICE",
+                    "category": category,
+                    "title": "notice",
+                    "contents": "notice contents",
+                    "resource_group": "DOMAIN",
+                    "domain_id": self.domain_id,
+                    "user_id": "admin@example.com",
+                }
+            )
+
+    def _delete_post(self, post_id: str) -> None:
+        self._make_service().delete(
+            {"post_id": post_id, "domain_id": self.domain_id}
+        )
+
+    def _stat(self) -> dict:
+        # The domain_id filter is appended to the query in place.
+        result = self._make_service().stat(
+            {"query": copy.deepcopy(STAT_QUERY), "domain_id": self.domain_id}
+        )
+        return {row["category"]: row["count"] for row in result["results"]}
+
+    def _stat_from_posts(self, **query) -> dict:
+        # Post.stat runs an aggregation pipeline that mongomock cannot, so
+        # the fallback is answered from the posts themselves.
+        counts = {}
+        for post_vo in Post.objects.filter(domain_id=self.domain_id):
+            counts[post_vo.category] = counts.get(post_vo.category, 0) + 1
+
+        return {
+            "results": [
+                {"category": category, "count": count}
+                for category, count in counts.items()
+            ]
+        }
+
+    def test_stat_after_writes_before_first_build(self):
+        PostFactory.create_batch(3, domain_id=self.domain_id, category="release")
+
+        # Written before the counts are built for the first time.
+        self._create_post("event")
+        release_post_vo = Post.objects.filter(category="release").first()
+        self._delete_post(release_post_vo.post_id)
+
+        self.assertEqual(self._stat(), {"release": 2, "event": 1})
+        self.assertEqual(PostCountState.objects.get().state, "READY")
+
+        # Afterwards the counts are kept up to date by every write.
+        event_post_vo = self._create_post("event")
+        self._delete_post(event_post_vo.post_id)
+        self._create_post("maintenance")
+
+        self.assertEqual(self._stat(), {"release": 2, "event": 1, "maintenance": 1})
+
+    def test_posts_created_during_build_are_counted_once(self):
+        PostFactory.create_batch(2, domain_id=self.domain_id, category="release")
+
+        started_at = datetime.datetime.utcnow().replace(microsecond=0)
+        PostCountState.objects.create(
+            name="post_count", state="BUILDING", started_at=started_at
+        )
+
+        # While the build has not finished, stats are served from Post.
+        self._create_post("release")
+        with patch.object(Post, "stat", side_effect=self._stat_from_posts) as mock_stat:
+            self.assertEqual(self._stat(), {"release": 3})
+            mock_stat.assert_called_once()
+
+        post_count_mgr = self._make_service().post_mgr.post_count_mgr
+        post_count_mgr._build_post_counts(
+            PostCountState._get_collection().find_one({})
+        )
+
+        post_count_vo = PostCount.objects.get(
+            domain_id=self.domain_id, category="release"
+        )
+        self.assertEqual(post_count_vo.base_count, 2)
+        self.assertEqual(post_count_vo.count, 1)
+        self.assertEqual(self._stat(), {"release": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()